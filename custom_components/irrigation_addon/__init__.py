@@ -1,9 +1,12 @@
 """The Irrigation Addon integration."""
 from __future__ import annotations
 
+import inspect
 import logging
+import os
 from typing import Any
 
+from homeassistant.components import frontend
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -11,16 +14,22 @@ from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
 from .coordinator import IrrigationCoordinator
+from .models import IrrigationDomainData
 from .services import IrrigationServices
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
+# Older frontend versions do not accept require_admin for built-in panels
+_PANEL_SUPPORTS_REQUIRE_ADMIN = "require_admin" in inspect.signature(
+    frontend.async_register_built_in_panel
+).parameters
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Irrigation Addon component."""
-    hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, IrrigationDomainData())
     return True
 
 
@@ -28,21 +37,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Irrigation Addon from a config entry."""
     _LOGGER.debug("Setting up Irrigation Addon integration")
     
-    # Create coordinator
-    coordinator = IrrigationCoordinator(hass, entry)
-    
-    # Store coordinator in hass data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-    
-    # Setup coordinator (loads storage)
-    await coordinator.async_setup()
-    
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-    
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Create coordinator and set up platforms
+    coordinator = await _async_setup_coordinator(hass, entry)
     
     # Register services
     await _async_register_services(hass, coordinator)
@@ -64,10 +60,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         # Remove coordinator from hass data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data: IrrigationDomainData = hass.data[DOMAIN]
+        domain_data.coordinators.pop(entry.entry_id, None)
         
         # Remove services if this was the last entry
-        if not hass.data[DOMAIN]:
+        if not domain_data.coordinators:
             _async_remove_services(hass)
             _async_remove_panel(hass)
     
@@ -75,23 +72,53 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Reload config entry, keeping services and the panel registered."""
+    domain_data: IrrigationDomainData = hass.data[DOMAIN]
+    coordinator = domain_data.coordinators.get(entry.entry_id)
+    if coordinator is None:
+        _LOGGER.warning("Cannot reload Irrigation Addon entry %s: not set up", entry.entry_id)
+        return False
+    
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    
+    # The entry stays loaded, so reuse its coordinator rather than running
+    # another first refresh
+    await coordinator.async_reload_storage()
+    await coordinator.async_refresh()
+    
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> IrrigationCoordinator:
+    """Create the coordinator for an entry and set up its platforms."""
+    coordinator = IrrigationCoordinator(hass, entry)
+    
+    # Store coordinator in hass data
+    domain_data: IrrigationDomainData = hass.data[DOMAIN]
+    domain_data.coordinators[entry.entry_id] = coordinator
+    
+    # Load storage and fetch initial data
+    await coordinator.async_config_entry_first_refresh()
+    
+    # Set up platforms
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return coordinator
+
+
 async def _async_register_services(hass: HomeAssistant, coordinator: IrrigationCoordinator) -> None:
     """Register integration services."""
     try:
         # Create services handler if it doesn't exist
-        if DOMAIN not in hass.data:
-            hass.data[DOMAIN] = {}
+        domain_data: IrrigationDomainData = hass.data[DOMAIN]
         
-        if "services" not in hass.data[DOMAIN]:
+        if domain_data.services is None:
             services = IrrigationServices(hass)
             services.async_register_services()
-            hass.data[DOMAIN]["services"] = services
+            domain_data.services = services
             _LOGGER.info("Irrigation services registered")
         
     except Exception as e:
@@ -101,10 +128,10 @@ async def _async_register_services(hass: HomeAssistant, coordinator: IrrigationC
 def _async_remove_services(hass: HomeAssistant) -> None:
     """Remove integration services."""
     try:
-        if DOMAIN in hass.data and "services" in hass.data[DOMAIN]:
-            services = hass.data[DOMAIN]["services"]
-            services.async_remove_services()
-            del hass.data[DOMAIN]["services"]
+        domain_data: IrrigationDomainData | None = hass.data.get(DOMAIN)
+        if domain_data is not None and domain_data.services is not None:
+            domain_data.services.async_remove_services()
+            domain_data.services = None
             _LOGGER.info("Irrigation services removed")
             
     except Exception as e:
@@ -113,15 +140,13 @@ def _async_remove_services(hass: HomeAssistant) -> None:
 
 async def _async_register_panel(hass: HomeAssistant) -> None:
     """Register the web panel."""
-    import os
-    
     try:
-        # Check if panel files exist
+        # Check if panel files exist without blocking the event loop
         www_path = hass.config.path(f"custom_components/{DOMAIN}/www")
         html_file = os.path.join(www_path, "irrigation-panel.html")
         
-        _LOGGER.debug(f"Checking for panel files at: {www_path}")
-        _LOGGER.debug(f"HTML file exists: {os.path.exists(html_file)}")
+        if not await hass.async_add_executor_job(os.path.exists, html_file):
+            _LOGGER.warning("Irrigation panel file not found at %s", html_file)
         
         # Register static files for the web panel
         hass.http.register_static_path(
@@ -131,54 +156,29 @@ async def _async_register_panel(hass: HomeAssistant) -> None:
         )
         _LOGGER.debug("Static path registered successfully")
         
-        # Register the irrigation panel in the sidebar using the correct method
-        hass.components.frontend.async_register_built_in_panel(
-            component_name="iframe",
-            sidebar_title="Irrigation",
-            sidebar_icon="mdi:sprinkler-variant",
-            frontend_url_path="irrigation",
-            config={
-                "url": f"/api/{DOMAIN}/www/irrigation-panel.html"
-            },
-            require_admin=False,
-        )
+        # Register the irrigation panel in the sidebar
+        panel_kwargs: dict[str, Any] = {
+            "sidebar_title": "Irrigation",
+            "sidebar_icon": "mdi:sprinkler-variant",
+            "frontend_url_path": "irrigation",
+            "config": {"url": f"/api/{DOMAIN}/www/irrigation-panel.html"},
+        }
+        if _PANEL_SUPPORTS_REQUIRE_ADMIN:
+            panel_kwargs["require_admin"] = False
+        
+        frontend.async_register_built_in_panel(hass, "iframe", **panel_kwargs)
         
         _LOGGER.info("Irrigation panel registered successfully in sidebar")
         
     except Exception as e:
         _LOGGER.error("Failed to register irrigation panel: %s", e)
-        # Try alternative registration method for older HA versions
-        try:
-            hass.components.frontend.async_register_built_in_panel(
-                "iframe",
-                "Irrigation",
-                "mdi:sprinkler-variant",
-                "irrigation",
-                {"url": f"/api/{DOMAIN}/www/irrigation-panel.html"},
-                require_admin=False,
-            )
-            _LOGGER.info("Irrigation panel registered with alternative method")
-        except Exception as e2:
-            _LOGGER.error("Alternative panel registration also failed: %s", e2)
-            # Final fallback - try the simplest registration
-            try:
-                hass.components.frontend.async_register_built_in_panel(
-                    "iframe",
-                    "Irrigation",
-                    "mdi:sprinkler-variant",
-                    "irrigation",
-                    {"url": f"/api/{DOMAIN}/www/irrigation-panel.html"}
-                )
-                _LOGGER.info("Irrigation panel registered with simple method")
-            except Exception as e3:
-                _LOGGER.error("All panel registration methods failed: %s", e3)
 
 
 def _async_remove_panel(hass: HomeAssistant) -> None:
     """Remove the web panel."""
     try:
         # Remove the panel from frontend
-        hass.components.frontend.async_remove_panel("irrigation")
+        frontend.async_remove_panel(hass, "irrigation")
         _LOGGER.info("Irrigation panel removed successfully")
         
     except Exception as e:
@@ -2,14 +2,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import time
+from typing import Any, Iterable
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import selector
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers import entity_registry as er, selector
+from homeassistant.helpers.entity_registry import (
+    EntityRegistry,
+    RegistryEntry,
+    async_get as async_get_entity_registry,
+)
 
 from .const import (
     DOMAIN,
@@ -21,21 +26,75 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds an entity listing stays valid between options flow form renders
+_DOMAIN_ENTITY_CACHE_TTL = 3.0
+
+
+def _scan_entries_for_domain(
+    entity_registry: EntityRegistry, domain: str
+) -> Iterable[RegistryEntry]:
+    """Get registry entries for a domain by scanning every entry."""
+    return (
+        entity for entity in entity_registry.entities.values() if entity.domain == domain
+    )
+
+
+def _indexed_entries_for_domain(
+    entity_registry: EntityRegistry, domain: str
+) -> Iterable[RegistryEntry]:
+    """Get registry entries for a domain from the registry's domain index."""
+    return entity_registry.entities.get_entries_for_domain(domain)
+
+
+# Use the registry's domain index when this Home Assistant version provides one
+_entries_for_domain = (
+    _indexed_entries_for_domain
+    if hasattr(getattr(er, "EntityRegistryItems", None), "get_entries_for_domain")
+    else _scan_entries_for_domain
+)
+
+# (key, default, validator) for each system setting shown in the flows
+_SETTINGS_FIELDS = (
+    ("pump_zone_delay", DEFAULT_PUMP_ZONE_DELAY, vol.All(vol.Coerce(int), vol.Range(min=1, max=30))),
+    ("sensor_update_interval", DEFAULT_SENSOR_UPDATE_INTERVAL, vol.All(vol.Coerce(int), vol.Range(min=10, max=300))),
+    ("default_manual_duration", DEFAULT_MANUAL_DURATION, vol.All(vol.Coerce(int), vol.Range(min=30, max=3600))),
+    ("fail_safe_enabled", DEFAULT_FAIL_SAFE_ENABLED, bool),
+)
+
+
+def _settings_schema(current_settings: dict[str, Any]) -> vol.Schema:
+    """Build the settings schema with defaults taken from current settings."""
+    return vol.Schema({
+        vol.Optional(key, default=current_settings.get(key, default)): validator
+        for key, default, validator in _SETTINGS_FIELDS
+    })
+
+
+STEP_SETTINGS_DATA_SCHEMA = _settings_schema({})
+
 STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Required("name", default="Irrigation System"): str,
+}).extend(STEP_SETTINGS_DATA_SCHEMA.schema)
+
+STEP_ROOMS_DATA_SCHEMA = vol.Schema({
+    vol.Required("action"): selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                {"value": "add_room", "label": "Add New Room"},
+                {"value": "edit_room", "label": "Edit Existing Room"},
+                {"value": "delete_room", "label": "Delete Room"},
+            ],
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    ),
 })
 
-STEP_SETTINGS_DATA_SCHEMA = vol.Schema({
-    vol.Optional("pump_zone_delay", default=DEFAULT_PUMP_ZONE_DELAY): vol.All(
-        vol.Coerce(int), vol.Range(min=1, max=30)
-    ),
-    vol.Optional("sensor_update_interval", default=DEFAULT_SENSOR_UPDATE_INTERVAL): vol.All(
-        vol.Coerce(int), vol.Range(min=10, max=300)
-    ),
-    vol.Optional("default_manual_duration", default=DEFAULT_MANUAL_DURATION): vol.All(
-        vol.Coerce(int), vol.Range(min=30, max=3600)
-    ),
-    vol.Optional("fail_safe_enabled", default=DEFAULT_FAIL_SAFE_ENABLED): bool,
+STEP_ADD_ROOM_BASE_SCHEMA = vol.Schema({
+    vol.Required("room_name"): str,
+})
+
+STEP_DELETE_ROOM_DATA_SCHEMA = vol.Schema({
+    vol.Required("confirm_delete", default=False): bool,
 })
 
 
@@ -44,11 +103,6 @@ class IrrigationAddonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
-    def __init__(self) -> None:
-        """Initialize the config flow."""
-        self._name: str | None = None
-        self._settings: dict[str, Any] = {}
-
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -60,56 +114,20 @@ class IrrigationAddonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(DOMAIN)
             self._abort_if_unique_id_configured()
 
-            self._name = user_input["name"]
-            return await self.async_step_settings()
-
-        return self.async_show_form(
-            step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
-            errors=errors,
-        )
-
-    async def async_step_settings(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle the settings step."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            self._settings = user_input
-            return await self.async_step_confirm()
-
-        return self.async_show_form(
-            step_id="settings",
-            data_schema=STEP_SETTINGS_DATA_SCHEMA,
-            errors=errors,
-            description_placeholders={
-                "name": self._name,
-            },
-        )
-
-    async def async_step_confirm(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle the confirmation step."""
-        if user_input is not None:
+            settings = dict(user_input)
+            name = settings.pop("name")
             return self.async_create_entry(
-                title=self._name,
+                title=name,
                 data={
-                    "name": self._name,
-                    "settings": self._settings,
+                    "name": name,
+                    "settings": settings,
                 },
             )
 
         return self.async_show_form(
-            step_id="confirm",
-            description_placeholders={
-                "name": self._name,
-                "pump_zone_delay": str(self._settings.get("pump_zone_delay", DEFAULT_PUMP_ZONE_DELAY)),
-                "sensor_update_interval": str(self._settings.get("sensor_update_interval", DEFAULT_SENSOR_UPDATE_INTERVAL)),
-                "default_manual_duration": str(self._settings.get("default_manual_duration", DEFAULT_MANUAL_DURATION)),
-                "fail_safe_enabled": "Yes" if self._settings.get("fail_safe_enabled", DEFAULT_FAIL_SAFE_ENABLED) else "No",
-            },
+            step_id="user",
+            data_schema=STEP_USER_DATA_SCHEMA,
+            errors=errors,
         )
 
     @staticmethod
@@ -129,6 +147,7 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
         self._settings: dict[str, Any] = {}
         self._selected_room_id: str | None = None
+        self._domain_entity_cache: dict[str, tuple[float, list[str]]] = {}
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -153,24 +172,7 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
         # Get current settings from config entry
         current_settings = self.config_entry.data.get("settings", {})
         
-        options_schema = vol.Schema({
-            vol.Optional(
-                "pump_zone_delay", 
-                default=current_settings.get("pump_zone_delay", DEFAULT_PUMP_ZONE_DELAY)
-            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
-            vol.Optional(
-                "sensor_update_interval", 
-                default=current_settings.get("sensor_update_interval", DEFAULT_SENSOR_UPDATE_INTERVAL)
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
-            vol.Optional(
-                "default_manual_duration", 
-                default=current_settings.get("default_manual_duration", DEFAULT_MANUAL_DURATION)
-            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
-            vol.Optional(
-                "fail_safe_enabled", 
-                default=current_settings.get("fail_safe_enabled", DEFAULT_FAIL_SAFE_ENABLED)
-            ): bool,
-        })
+        options_schema = _settings_schema(current_settings)
 
         return self.async_show_form(
             step_id="settings",
@@ -198,32 +200,13 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
                     return await self.async_step_delete_room()
 
         # Get current rooms
-        coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-        rooms = coordinator.storage.get_rooms()
-
-        room_options = [f"{room_id}: {room.name}" for room_id, room in rooms.items()]
+        coordinator = self.hass.data[DOMAIN].coordinators[self.config_entry.entry_id]
+        room_options = coordinator.storage.get_room_options()
         
-        room_schema = vol.Schema({
-            vol.Required("action"): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        {"value": "add_room", "label": "Add New Room"},
-                        {"value": "edit_room", "label": "Edit Existing Room"},
-                        {"value": "delete_room", "label": "Delete Room"},
-                    ],
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-        })
-
+        room_schema = STEP_ROOMS_DATA_SCHEMA
         if room_options:
             room_schema = room_schema.extend({
-                vol.Optional("selected_room"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=room_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
+                vol.Optional("selected_room"): _dropdown_selector(room_options),
             })
 
         return self.async_show_form(
@@ -231,45 +214,61 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
             data_schema=room_schema,
         )
 
+    def _get_domain_entities(
+        self, entity_registry: EntityRegistry, domain: str
+    ) -> list[str]:
+        """Get entities for a domain, reusing a recent listing if available."""
+        now = time.monotonic()
+        cached = self._domain_entity_cache.get(domain)
+        if cached is not None and now - cached[0] < _DOMAIN_ENTITY_CACHE_TTL:
+            return cached[1]
+
+        # Selector options must stay a list (the selector schema rejects tuples),
+        # so the cached list itself is shared by every selector for this domain
+        entities = _get_entities_by_domain(entity_registry, self.hass, domain)
+        self._domain_entity_cache[domain] = (now, entities)
+        return entities
+
     async def async_step_add_room(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle adding a new room."""
         errors: dict[str, str] = {}
+        entity_registry = async_get_entity_registry(self.hass)
 
         if user_input is not None:
             # Validate room name is unique
-            coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-            existing_rooms = coordinator.storage.get_rooms()
+            coordinator = self.hass.data[DOMAIN].coordinators[self.config_entry.entry_id]
             
             room_name = user_input["room_name"].strip()
-            if any(room.name.lower() == room_name.lower() for room in existing_rooms.values()):
+            if room_name.lower() in coordinator.storage.get_room_names_lower():
                 errors["room_name"] = "duplicate_room"
             
             # Validate pump entity
+            known_entities = _get_known_entity_ids(self.hass, entity_registry)
             pump_entity = user_input["pump_entity"]
             if not pump_entity:
                 errors["pump_entity"] = "no_pump_entity"
-            elif not await _validate_entity_exists(self.hass, pump_entity):
+            elif pump_entity not in known_entities:
                 errors["pump_entity"] = "invalid_pump_entity"
             
             # Validate zone entities
             zone_entities = user_input.get("zone_entities", [])
             for zone_entity in zone_entities:
-                if not await _validate_entity_exists(self.hass, zone_entity):
+                if zone_entity not in known_entities:
                     errors["zone_entities"] = "invalid_zone_entity"
                     break
             
             # Validate optional entities
             light_entity = user_input.get("light_entity")
-            if light_entity and not await _validate_entity_exists(self.hass, light_entity):
+            if light_entity and light_entity not in known_entities:
                 errors["light_entity"] = "invalid_light_entity"
             
             # Validate sensor entities
             sensor_fields = ["soil_rh_sensor", "temperature_sensor", "ec_sensor"]
             for field in sensor_fields:
                 sensor_entity = user_input.get(field)
-                if sensor_entity and not await _validate_entity_exists(self.hass, sensor_entity):
+                if sensor_entity and sensor_entity not in known_entities:
                     errors[field] = "invalid_sensor_entity"
             
             if not errors:
@@ -290,54 +289,24 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
                 room_data["sensors"] = {k: v for k, v in room_data["sensors"].items() if v}
                 
                 await coordinator.storage.add_room(room_data)
-                await coordinator.async_request_refresh()
+                self.hass.async_create_task(coordinator.async_request_refresh())
                 
                 return self.async_create_entry(title="", data={})
 
         # Get available entities for selectors
-        switch_entities = await _get_entities_by_domain(self.hass, "switch")
-        light_entities = await _get_entities_by_domain(self.hass, "light")
-        sensor_entities = await _get_entities_by_domain(self.hass, "sensor")
-
-        add_room_schema = vol.Schema({
-            vol.Required("room_name"): str,
-            vol.Required("pump_entity"): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=switch_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            vol.Optional("zone_entities", default=[]): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=switch_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                    multiple=True,
-                )
-            ),
-            vol.Optional("light_entity"): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=light_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            vol.Optional("soil_rh_sensor"): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=sensor_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            vol.Optional("temperature_sensor"): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=sensor_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            vol.Optional("ec_sensor"): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=sensor_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
+        switch_entities = self._get_domain_entities(entity_registry, "switch")
+        light_entities = self._get_domain_entities(entity_registry, "light")
+        sensor_entities = self._get_domain_entities(entity_registry, "sensor")
+
+        add_room_schema = STEP_ADD_ROOM_BASE_SCHEMA.extend({
+            vol.Required("pump_entity"): _dropdown_selector(switch_entities),
+            vol.Optional("zone_entities", default=[]): _dropdown_selector(
+                switch_entities, multiple=True
             ),
+            vol.Optional("light_entity"): _dropdown_selector(light_entities),
+            vol.Optional("soil_rh_sensor"): _dropdown_selector(sensor_entities),
+            vol.Optional("temperature_sensor"): _dropdown_selector(sensor_entities),
+            vol.Optional("ec_sensor"): _dropdown_selector(sensor_entities),
         })
 
         return self.async_show_form(
@@ -351,8 +320,9 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Handle editing an existing room."""
         errors: dict[str, str] = {}
+        entity_registry = async_get_entity_registry(self.hass)
         
-        coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
+        coordinator = self.hass.data[DOMAIN].coordinators[self.config_entry.entry_id]
         rooms = coordinator.storage.get_rooms()
         
         if self._selected_room_id not in rooms:
@@ -364,37 +334,38 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             # Validate room name is unique (excluding current room)
             room_name = user_input["room_name"].strip()
-            if any(
-                room.name.lower() == room_name.lower() 
-                for room_id, room in rooms.items() 
-                if room_id != self._selected_room_id
+            room_name_lower = room_name.lower()
+            if (
+                room_name_lower != current_room.name.lower()
+                and room_name_lower in coordinator.storage.get_room_names_lower()
             ):
                 errors["room_name"] = "duplicate_room"
             
             # Validate pump entity
+            known_entities = _get_known_entity_ids(self.hass, entity_registry)
             pump_entity = user_input["pump_entity"]
             if not pump_entity:
                 errors["pump_entity"] = "no_pump_entity"
-            elif not await _validate_entity_exists(self.hass, pump_entity):
+            elif pump_entity not in known_entities:
                 errors["pump_entity"] = "invalid_pump_entity"
             
             # Validate zone entities
             zone_entities = user_input.get("zone_entities", [])
             for zone_entity in zone_entities:
-                if not await _validate_entity_exists(self.hass, zone_entity):
+                if zone_entity not in known_entities:
                     errors["zone_entities"] = "invalid_zone_entity"
                     break
             
             # Validate optional entities
             light_entity = user_input.get("light_entity")
-            if light_entity and not await _validate_entity_exists(self.hass, light_entity):
+            if light_entity and light_entity not in known_entities:
                 errors["light_entity"] = "invalid_light_entity"
             
             # Validate sensor entities
             sensor_fields = ["soil_rh_sensor", "temperature_sensor", "ec_sensor"]
             for field in sensor_fields:
                 sensor_entity = user_input.get(field)
-                if sensor_entity and not await _validate_entity_exists(self.hass, sensor_entity):
+                if sensor_entity and sensor_entity not in known_entities:
                     errors[field] = "invalid_sensor_entity"
             
             if not errors:
@@ -415,53 +386,34 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
                 room_data["sensors"] = {k: v for k, v in room_data["sensors"].items() if v}
                 
                 await coordinator.storage.update_room(self._selected_room_id, room_data)
-                await coordinator.async_request_refresh()
+                self.hass.async_create_task(coordinator.async_request_refresh())
                 
                 return self.async_create_entry(title="", data={})
 
         # Get available entities for selectors
-        switch_entities = await _get_entities_by_domain(self.hass, "switch")
-        light_entities = await _get_entities_by_domain(self.hass, "light")
-        sensor_entities = await _get_entities_by_domain(self.hass, "sensor")
+        switch_entities = self._get_domain_entities(entity_registry, "switch")
+        light_entities = self._get_domain_entities(entity_registry, "light")
+        sensor_entities = self._get_domain_entities(entity_registry, "sensor")
 
         edit_room_schema = vol.Schema({
             vol.Required("room_name", default=current_room.name): str,
-            vol.Required("pump_entity", default=current_room.pump_entity): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=switch_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
+            vol.Required("pump_entity", default=current_room.pump_entity): _dropdown_selector(
+                switch_entities
             ),
-            vol.Optional("zone_entities", default=current_room.zone_entities): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=switch_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                    multiple=True,
-                )
+            vol.Optional("zone_entities", default=current_room.zone_entities): _dropdown_selector(
+                switch_entities, multiple=True
             ),
-            vol.Optional("light_entity", default=current_room.light_entity): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=light_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
+            vol.Optional("light_entity", default=current_room.light_entity): _dropdown_selector(
+                light_entities
             ),
-            vol.Optional("soil_rh_sensor", default=current_room.sensors.get("soil_rh")): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=sensor_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
+            vol.Optional("soil_rh_sensor", default=current_room.sensors.get("soil_rh")): _dropdown_selector(
+                sensor_entities
             ),
-            vol.Optional("temperature_sensor", default=current_room.sensors.get("temperature")): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=sensor_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
+            vol.Optional("temperature_sensor", default=current_room.sensors.get("temperature")): _dropdown_selector(
+                sensor_entities
             ),
-            vol.Optional("ec_sensor", default=current_room.sensors.get("ec")): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=sensor_entities,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
+            vol.Optional("ec_sensor", default=current_room.sensors.get("ec")): _dropdown_selector(
+                sensor_entities
             ),
         })
 
@@ -478,7 +430,7 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle deleting a room."""
-        coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
+        coordinator = self.hass.data[DOMAIN].coordinators[self.config_entry.entry_id]
         rooms = coordinator.storage.get_rooms()
         
         if self._selected_room_id not in rooms:
@@ -489,49 +441,49 @@ class IrrigationAddonOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             if user_input.get("confirm_delete"):
                 await coordinator.storage.delete_room(self._selected_room_id)
-                await coordinator.async_request_refresh()
+                self.hass.async_create_task(coordinator.async_request_refresh())
                 return self.async_create_entry(title="", data={})
             else:
                 return await self.async_step_rooms()
 
-        delete_room_schema = vol.Schema({
-            vol.Required("confirm_delete", default=False): bool,
-        })
-
         return self.async_show_form(
             step_id="delete_room",
-            data_schema=delete_room_schema,
+            data_schema=STEP_DELETE_ROOM_DATA_SCHEMA,
             description_placeholders={
                 "room_name": current_room.name,
             },
         )
 
 
-async def _validate_entity_exists(hass: HomeAssistant, entity_id: str) -> bool:
-    """Validate that an entity exists in Home Assistant."""
-    entity_registry = async_get_entity_registry(hass)
-    
-    # Check if entity exists in registry
-    if entity_registry.async_get(entity_id):
-        return True
-    
-    # Check if entity exists in states
-    state = hass.states.get(entity_id)
-    return state is not None
+def _dropdown_selector(options: list[str], multiple: bool = False) -> selector.SelectSelector:
+    """Build a dropdown selector over the given options."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+            multiple=multiple,
+        )
+    )
+
 
+def _get_known_entity_ids(
+    hass: HomeAssistant, entity_registry: EntityRegistry
+) -> set[str]:
+    """Get the ids of all entities in the registry or the state machine."""
+    entity_ids = set(entity_registry.entities)
+    entity_ids.update(hass.states.async_entity_ids())
+    return entity_ids
 
-async def _get_entities_by_domain(hass: HomeAssistant, domain: str) -> list[str]:
+
+def _get_entities_by_domain(
+    entity_registry: EntityRegistry, hass: HomeAssistant, domain: str
+) -> list[str]:
     """Get all entities for a specific domain."""
-    entity_registry = async_get_entity_registry(hass)
-    entities = []
-    
-    for entity in entity_registry.entities.values():
-        if entity.entity_id.startswith(f"{domain}."):
-            entities.append(entity.entity_id)
+    entities = {
+        entity.entity_id for entity in _entries_for_domain(entity_registry, domain)
+    }
     
-    # Also check current states for entities not in registry
-    for entity_id in hass.states.async_entity_ids(domain):
-        if entity_id not in entities:
-            entities.append(entity_id)
+    # Also include current states for entities not in registry
+    entities.update(hass.states.async_entity_ids(domain))
     
-    return sorted(entities)
\ No newline at end of file
+    return sorted(entities)
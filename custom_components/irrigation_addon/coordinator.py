@@ -2,21 +2,41 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter, defaultdict, deque
+from functools import lru_cache, partial
+from itertools import islice
+import hashlib
+import inspect
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
 from croniter import croniter
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.event import async_track_time_interval, async_track_point_in_time
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_interval,
+)
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, DEFAULT_SENSOR_UPDATE_INTERVAL
+from .const import (
+    DOMAIN,
+    DEFAULT_SENSOR_UPDATE_INTERVAL,
+    DEFAULT_PUMP_ZONE_DELAY,
+    DEFAULT_FAIL_SAFE_ENABLED,
+    DEFAULT_EMERGENCY_STOP_ENABLED,
+    DEFAULT_NOTIFICATIONS_ENABLED,
+    DEFAULT_ERROR_NOTIFICATIONS,
+    DEFAULT_MAX_DAILY_IRRIGATION
+)
 from .storage import IrrigationStorage
-from .models import Room, IrrigationEvent, Shot
+from .models import ActiveIrrigation, Room, IrrigationEvent, Shot
 from .exceptions import (
     IrrigationError, EntityUnavailableError, LightScheduleConflictError,
     OverWateringError, IrrigationConflictError, HardwareControlError,
@@ -26,48 +46,170 @@ from .logging_utils import get_irrigation_logger, PerformanceTracker, Diagnostic
 
 _LOGGER = logging.getLogger(__name__)
 
+# Newer Home Assistant versions accept config_entry and always_update directly
+_COORDINATOR_PARAMS = inspect.signature(DataUpdateCoordinator.__init__).parameters
+_COORDINATOR_ACCEPTS_CONFIG_ENTRY = "config_entry" in _COORDINATOR_PARAMS
+_COORDINATOR_ACCEPTS_ALWAYS_UPDATE = "always_update" in _COORDINATOR_PARAMS
+
+# Home Assistant 2024.8+ runs _async_setup from async_config_entry_first_refresh
+_COORDINATOR_HAS_SETUP_HOOK = hasattr(DataUpdateCoordinator, "_async_setup")
+
+# Newer Home Assistant versions can start a task's first step immediately
+_CREATE_TASK_ACCEPTS_EAGER_START = "eager_start" in inspect.signature(HomeAssistant.async_create_task).parameters
+_EAGER_TASK_KWARGS: Dict[str, Any] = {"eager_start": True} if _CREATE_TASK_ACCEPTS_EAGER_START else {}
+
+
+class CheckResult(NamedTuple):
+    """Outcome of a fail-safe check."""
+
+    allowed: bool
+    reason: str = ""
+
+
+# Shared result for fail-safe checks that let irrigation proceed
+_ALLOW = CheckResult(True)
+
+# Sensor states that carry no reading
+_BAD_STATES = frozenset({"unknown", "unavailable"})
+
+# Reading reported for a sensor that is missing or has no usable state
+_UNAVAILABLE_READING: Dict[str, Any] = {
+    "value": None,
+    "unit": None,
+    "last_updated": None,
+    "unavailable": True
+}
+
+# Maximum number of formatted sensor timestamps kept between updates
+_ISO_CACHE_SIZE = 512
+
+# Seconds to batch room changes from scheduled runs before writing them to storage
+_ROOM_FLUSH_DELAY = 60
+
+# Seconds to wait for a single device to turn off during an emergency reset
+_EMERGENCY_CALL_TIMEOUT = 2
+
+
+def _never_notify(notification_type: str = "general") -> bool:
+    """Notification gate used while notifications are disabled."""
+    return False
+
+
+def _notify_except_errors(notification_type: str = "general") -> bool:
+    """Notification gate used while error notifications are disabled."""
+    return notification_type != "error"
+
+
+def _always_notify(notification_type: str = "general") -> bool:
+    """Notification gate used while all notifications are enabled."""
+    return True
+
+
+@lru_cache(maxsize=128)
+def _message_digest(message: str) -> str:
+    """Return a digest of a notification message that is stable across restarts."""
+    return hashlib.blake2b(message.encode(), digest_size=8).hexdigest()
+
 
 class IrrigationCoordinator(DataUpdateCoordinator):
     """Irrigation coordinator for managing data updates and scheduling."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
-        self.entry = entry
         self.storage = IrrigationStorage(hass)
         self._rooms: Dict[str, Room] = {}
         self._settings: Dict[str, Any] = {}
         
+        # Read-only views handed out by the rooms/settings properties
+        self._rooms_view: MappingProxyType[str, Room] = MappingProxyType(self._rooms)
+        self._settings_view: MappingProxyType[str, Any] = MappingProxyType(self._settings)
+        self._update_notification_gate()
+        
         # Enhanced logging and monitoring
         self.irrigation_logger = get_irrigation_logger(f"{__name__}.{entry.entry_id}", hass)
         self.performance_tracker = PerformanceTracker(self.irrigation_logger)
         self.diagnostic_collector = DiagnosticCollector(hass, self.irrigation_logger)
         
         # Error tracking
-        self._error_counts: Dict[str, int] = {}
-        self._last_errors: List[Dict[str, Any]] = []
         self._max_error_history = 50
+        self._error_counts: Counter[Tuple[str, str]] = Counter()  # (operation, error type) -> count
+        self._last_errors: deque[Dict[str, Any]] = deque(maxlen=self._max_error_history)
+        self._error_timestamps: deque[float] = deque(maxlen=self._max_error_history)  # time.monotonic() per entry in _last_errors
+        self._error_stats_cache: Optional[Dict[str, Any]] = None  # statistics except error_rate, reset on every error
         
         # Scheduling and execution state
         self._scheduled_events: Dict[str, Any] = {}  # room_id -> {event_type: cancel_callback}
-        self._active_irrigations: Dict[str, Dict[str, Any]] = {}  # room_id -> irrigation_state
+        self._scheduled_events_total = 0  # number of cancel callbacks in _scheduled_events
+        self._active_irrigations: Dict[str, ActiveIrrigation] = {}  # room_id -> irrigation_state
         self._manual_runs: Dict[str, Dict[str, Any]] = {}  # room_id -> manual_run_state
-        self._daily_irrigation_totals: Dict[str, int] = {}  # room_id -> seconds_today
+        self._daily_irrigation_totals: defaultdict[str, int] = defaultdict(int)  # room_id -> seconds_today
+        self._cron_cache: Dict[Tuple[str, str], Tuple[str, croniter]] = {}  # (room_id, event_type) -> (schedule, croniter)
+        self._enabled_events_by_room: Dict[str, List[IrrigationEvent]] = {}  # room_id -> enabled events
         
         # Event tracking
-        self._event_listeners: Set[Any] = set()
+        self._event_listeners: List[Callable[[], None]] = []
+        self._daily_reset_cancel: Optional[Any] = None
+        
+        # Rooms whose last_run changed since the last storage write
+        self._dirty_rooms: Set[str] = set()
+        self._room_flush_cancel: Optional[Any] = None
+        self._stop_listener_cancel: Optional[Callable[[], None]] = None
+        
+        # Timer pushing run progress to listeners while water is running
+        self._progress_updates_cancel: Optional[Callable[[], None]] = None
+        
+        # Last sensor readings per room, keyed by the states they were built from
+        self._room_sensor_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any], List[str]]] = {}
+        self._iso_cache: Dict[datetime, str] = {}
         
         # Initialize with default update interval
         update_interval = timedelta(seconds=DEFAULT_SENSOR_UPDATE_INTERVAL)
         
+        # Only notify listeners when polled data actually changes
+        coordinator_kwargs: Dict[str, Any] = {}
+        if _COORDINATOR_ACCEPTS_CONFIG_ENTRY:
+            coordinator_kwargs["config_entry"] = entry
+        if _COORDINATOR_ACCEPTS_ALWAYS_UPDATE:
+            coordinator_kwargs["always_update"] = False
+        
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            **coordinator_kwargs,
         )
+        if not _COORDINATOR_ACCEPTS_CONFIG_ENTRY:
+            self.config_entry = entry
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Load storage, then fetch the initial data.
+
+        Older Home Assistant versions have no setup hook, so storage is
+        loaded here before delegating to the base implementation.
+        """
+        if not _COORDINATOR_HAS_SETUP_HOOK:
+            try:
+                await self._async_setup()
+            except Exception as e:
+                raise ConfigEntryNotReady(str(e)) from e
+        await super().async_config_entry_first_refresh()
 
-    async def async_setup(self) -> None:
-        """Set up the coordinator."""
+    async def _async_setup(self) -> None:
+        """Set up the coordinator.
+
+        Called once before the first update.
+        """
+        await self.async_reload_storage()
+        
+        # Entry unload does not run when Home Assistant stops, so write
+        # batched room changes out on stop as well
+        self._stop_listener_cancel = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_flush_on_stop
+        )
+
+    async def async_reload_storage(self) -> None:
+        """Load rooms and settings from storage and reschedule their events."""
         with IrrigationErrorHandler("coordinator_setup", self.irrigation_logger):
             self.performance_tracker.start_operation("coordinator_setup")
             
@@ -78,6 +220,12 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 # Load rooms and settings
                 self._rooms = await self.storage.async_get_rooms()
                 self._settings = await self.storage.async_get_settings()
+                self._rooms_view = MappingProxyType(self._rooms)
+                self._settings_view = MappingProxyType(self._settings)
+                self._update_notification_gate()
+                self._enabled_events_by_room = {
+                    room_id: self._enabled_events(room) for room_id, room in self._rooms.items()
+                }
                 
                 # Update coordinator interval based on settings
                 sensor_interval = self._settings.get("sensor_update_interval", DEFAULT_SENSOR_UPDATE_INTERVAL)
@@ -86,7 +234,9 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 # Initialize daily irrigation tracking
                 self._reset_daily_totals()
                 
-                # Schedule all irrigation events
+                # Schedule all irrigation events, dropping those of rooms
+                # that are gone after a reload
+                await self._cancel_all_scheduled_events()
                 await self._schedule_all_events()
                 
                 # Set up daily reset timer
@@ -116,17 +266,25 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Stop any active irrigations
             for room_id in list(self._active_irrigations.keys()):
-                await self.async_stop_irrigation(room_id)
+                await self.async_stop_irrigation(room_id, publish=False)
             
             # Stop any manual runs
             for room_id in list(self._manual_runs.keys()):
-                await self.async_stop_manual_run(room_id)
+                await self.async_stop_manual_run(room_id, publish=False)
             
             # Remove event listeners
             for listener in self._event_listeners:
                 listener()
             self._event_listeners.clear()
             
+            self._async_stop_progress_updates()
+            
+            # Write out any pending room changes
+            if self._stop_listener_cancel is not None:
+                self._stop_listener_cancel()
+                self._stop_listener_cancel = None
+            await self._async_flush_pending_rooms()
+            
             _LOGGER.info("Coordinator shutdown complete")
             
         except Exception as e:
@@ -134,61 +292,49 @@ class IrrigationCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from sensors and update irrigation status."""
+        # Nothing to poll without rooms
+        if not self._rooms:
+            return {
+                "rooms": self._rooms,
+                "sensor_data": {},
+                "settings": self._settings,
+                "system_health": self.get_system_health()
+            }
+        
         with IrrigationErrorHandler("sensor_data_update", self.irrigation_logger, suppress_exceptions=True):
             self.performance_tracker.start_operation("sensor_data_update")
             
             try:
-                # Update sensor data for all rooms
+                # Update sensor data for all rooms from one pass over the state machine
+                get_state = self.hass.states.get
                 sensor_data = {}
                 unavailable_sensors = []
+                room_sensor_cache = {}
                 
                 for room_id, room in self._rooms.items():
-                    room_sensors = {}
+                    room_states = [
+                        (sensor_type, entity_id, get_state(entity_id))
+                        for sensor_type, entity_id in room.sensors.items()
+                    ]
+                    signature = tuple(
+                        (sensor_type, entity_id, None if state is None else (state.state, state.last_updated))
+                        for sensor_type, entity_id, state in room_states
+                    )
                     
-                    # Read sensor values from Home Assistant
-                    for sensor_type, entity_id in room.sensors.items():
-                        try:
-                            state = self.hass.states.get(entity_id)
-                            if state and state.state not in ["unknown", "unavailable"]:
-                                try:
-                                    room_sensors[sensor_type] = {
-                                        "value": float(state.state),
-                                        "unit": state.attributes.get("unit_of_measurement"),
-                                        "last_updated": state.last_updated.isoformat()
-                                    }
-                                except (ValueError, TypeError):
-                                    room_sensors[sensor_type] = {
-                                        "value": state.state,
-                                        "unit": state.attributes.get("unit_of_measurement"),
-                                        "last_updated": state.last_updated.isoformat()
-                                    }
-                            else:
-                                room_sensors[sensor_type] = {
-                                    "value": None,
-                                    "unit": None,
-                                    "last_updated": None,
-                                    "unavailable": True
-                                }
-                                unavailable_sensors.append(f"{room_id}:{sensor_type}:{entity_id}")
-                        except Exception as sensor_error:
-                            self.irrigation_logger.warning(
-                                f"Failed to read sensor {entity_id}",
-                                room_id=room_id,
-                                sensor_type=sensor_type,
-                                entity_id=entity_id,
-                                error=str(sensor_error)
-                            )
-                            room_sensors[sensor_type] = {
-                                "value": None,
-                                "unit": None,
-                                "last_updated": None,
-                                "error": str(sensor_error)
-                            }
+                    # Reuse the previous readings when none of the room's sensors changed
+                    cached = self._room_sensor_cache.get(room_id)
+                    if cached is None or cached[0] != signature:
+                        room_sensors, room_unavailable = self._read_room_sensors(room_id, room_states)
+                        cached = (signature, room_sensors, room_unavailable)
                     
-                    sensor_data[room_id] = room_sensors
+                    room_sensor_cache[room_id] = cached
+                    sensor_data[room_id] = cached[1]
+                    unavailable_sensors.extend(cached[2])
+                
+                self._room_sensor_cache = room_sensor_cache
                 
                 # Log sensor availability issues
-                if unavailable_sensors:
+                if unavailable_sensors and self.irrigation_logger.is_debug_enabled():
                     self.irrigation_logger.debug(
                         f"Unavailable sensors detected: {len(unavailable_sensors)}",
                         unavailable_sensors=unavailable_sensors
@@ -224,15 +370,67 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             finally:
                 self.performance_tracker.end_operation("sensor_data_update")
 
+    def _read_room_sensors(
+        self, room_id: str, room_states: List[Tuple[str, str, Any]]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Build sensor readings for a room from (sensor_type, entity_id, state) tuples."""
+        room_sensors: Dict[str, Any] = {}
+        unavailable_sensors: List[str] = []
+        isoformat = self._isoformat_cached
+        
+        for sensor_type, entity_id, state in room_states:
+            try:
+                raw = None if state is None else state.state
+                if raw is None or raw in _BAD_STATES:
+                    room_sensors[sensor_type] = _UNAVAILABLE_READING.copy()
+                    unavailable_sensors.append(f"{room_id}:{sensor_type}:{entity_id}")
+                    continue
+                
+                try:
+                    value = float(raw)
+                except (ValueError, TypeError):
+                    value = raw
+                
+                room_sensors[sensor_type] = {
+                    "value": value,
+                    "unit": state.attributes.get("unit_of_measurement"),
+                    "last_updated": isoformat(state.last_updated)
+                }
+            except Exception as sensor_error:
+                self.irrigation_logger.warning(
+                    f"Failed to read sensor {entity_id}",
+                    room_id=room_id,
+                    sensor_type=sensor_type,
+                    entity_id=entity_id,
+                    error=str(sensor_error)
+                )
+                room_sensors[sensor_type] = {
+                    "value": None,
+                    "unit": None,
+                    "last_updated": None,
+                    "error": str(sensor_error)
+                }
+        
+        return room_sensors, unavailable_sensors
+
+    def _isoformat_cached(self, value: datetime) -> str:
+        """Format a sensor timestamp, reusing strings for repeated timestamps."""
+        iso = self._iso_cache.get(value)
+        if iso is None:
+            if len(self._iso_cache) >= _ISO_CACHE_SIZE:
+                self._iso_cache.clear()
+            iso = self._iso_cache[value] = value.isoformat()
+        return iso
+
     @property
-    def rooms(self) -> Dict[str, Room]:
-        """Get all rooms."""
-        return self._rooms
+    def rooms(self) -> Mapping[str, Room]:
+        """Get a read-only view of all rooms."""
+        return self._rooms_view
 
     @property
-    def settings(self) -> Dict[str, Any]:
-        """Get current settings."""
-        return self._settings
+    def settings(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current settings."""
+        return self._settings_view
 
     async def async_add_room(self, room: Room) -> None:
         """Add a new room."""
@@ -247,9 +445,10 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Update local cache
             self._rooms[room.room_id] = room
+            self._enabled_events_by_room[room.room_id] = self._enabled_events(room)
             
-            # Trigger data update
-            await self.async_request_refresh()
+            # Notify listeners without polling every room's sensors
+            self._async_publish_changes(room.room_id)
             
             _LOGGER.info("Room %s added successfully", room.room_id)
             
@@ -270,9 +469,11 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Update local cache
             self._rooms[room.room_id] = room
+            self._enabled_events_by_room[room.room_id] = self._enabled_events(room)
+            self._invalidate_cron_cache(room.room_id)
             
-            # Trigger data update
-            await self.async_request_refresh()
+            # Notify listeners without polling every room's sensors
+            self._async_publish_changes(room.room_id)
             
             _LOGGER.info("Room %s updated successfully", room.room_id)
             
@@ -289,9 +490,10 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             if success:
                 # Remove from local cache
                 self._rooms.pop(room_id, None)
+                self._enabled_events_by_room.pop(room_id, None)
                 
-                # Trigger data update
-                await self.async_request_refresh()
+                # Notify listeners without polling every room's sensors
+                self._async_publish_changes(room_id)
                 
                 _LOGGER.info("Room %s deleted successfully", room_id)
             else:
@@ -301,6 +503,63 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to delete room %s: %s", room_id, e)
             raise
 
+    @callback
+    def _async_start_progress_updates(self) -> None:
+        """Refresh listeners every update interval until no run is active.
+
+        Polled data does not change while a run progresses, so listeners
+        are told explicitly to pick up the remaining time and progress.
+        """
+        if self._progress_updates_cancel is None:
+            self._progress_updates_cancel = async_track_time_interval(
+                self.hass, self._async_progress_tick, self.update_interval
+            )
+
+    @callback
+    def _async_stop_progress_updates(self) -> None:
+        """Cancel the run progress timer."""
+        if self._progress_updates_cancel is not None:
+            self._progress_updates_cancel()
+            self._progress_updates_cancel = None
+
+    @callback
+    def _async_progress_tick(self, _now: datetime) -> None:
+        """Push run progress to listeners."""
+        if not (self._active_irrigations or self._manual_runs):
+            self._async_stop_progress_updates()
+        self.async_update_listeners()
+
+    @callback
+    def _async_publish_changes(self, room_id: Optional[str] = None) -> None:
+        """Push room, settings and run state changes to listeners.
+
+        Only the sensor readings of ``room_id`` are re-read, since the other
+        rooms' readings are unchanged by the mutation.
+        """
+        data = dict(self.data or {})
+        sensor_data = dict(data.get("sensor_data", {}))
+        
+        if room_id is not None:
+            self._room_sensor_cache.pop(room_id, None)
+            room = self._rooms.get(room_id)
+            if room is None:
+                sensor_data.pop(room_id, None)
+            else:
+                get_state = self.hass.states.get
+                room_states = [
+                    (sensor_type, entity_id, get_state(entity_id))
+                    for sensor_type, entity_id in room.sensors.items()
+                ]
+                sensor_data[room_id] = self._read_room_sensors(room_id, room_states)[0]
+        
+        data.update(rooms=self._rooms, sensor_data=sensor_data, settings=self._settings)
+        self.async_set_updated_data(data)
+
+    @staticmethod
+    def _enabled_events(room: Room) -> List[IrrigationEvent]:
+        """Return the enabled events of a room."""
+        return [event for event in room.events if event.enabled]
+
     async def async_get_room(self, room_id: str) -> Optional[Room]:
         """Get a specific room."""
         return self._rooms.get(room_id)
@@ -313,6 +572,7 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Update local cache
             self._settings.update(settings)
+            self._update_notification_gate()
             
             # Update coordinator interval if sensor_update_interval changed
             if "sensor_update_interval" in settings:
@@ -322,8 +582,8 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             if "logging_level" in settings:
                 self._update_logging_level(settings["logging_level"])
             
-            # Trigger data update
-            await self.async_request_refresh()
+            # Notify listeners without polling every room's sensors
+            self._async_publish_changes()
             
             _LOGGER.info("Settings updated successfully")
             
@@ -350,27 +610,30 @@ class IrrigationCoordinator(DataUpdateCoordinator):
     async def _schedule_event(self, room_id: str, event: IrrigationEvent) -> None:
         """Schedule a single irrigation event."""
         try:
-            # Parse cron expression and get next run time
+            # Reuse the parsed cron expression unless the schedule changed
             now = dt_util.now()
-            cron = croniter(event.schedule, now)
-            next_run = cron.get_next(datetime)
-            
-            # Update event next_run time
+            key = (room_id, event.event_type)
+            cached = self._cron_cache.get(key)
+            if cached is None or cached[0] != event.schedule:
+                cached = self._cron_cache[key] = (event.schedule, croniter(event.schedule, now))
+            next_run_timestamp = cached[1].get_next(float, start_time=now)
+            
+            # Update event next_run time in local time, as croniter computed it
+            next_run = dt_util.as_local(dt_util.utc_from_timestamp(next_run_timestamp))
             event.next_run = next_run
             
-            # Schedule the event
-            cancel_callback = async_track_point_in_time(
+            # Schedule the event as a loop-clock delay from the epoch timestamp
+            cancel_callback = async_call_later(
                 self.hass,
-                lambda dt, r_id=room_id, evt=event: self.hass.async_create_task(
-                    self._execute_scheduled_event(r_id, evt)
-                ),
-                next_run
+                max(next_run_timestamp - time.time(), 0),
+                partial(self._scheduled_event_callback, room_id, event)
             )
             
             # Store the cancel callback
-            if room_id not in self._scheduled_events:
-                self._scheduled_events[room_id] = {}
-            self._scheduled_events[room_id][event.event_type] = cancel_callback
+            room_events = self._scheduled_events.setdefault(room_id, {})
+            if event.event_type not in room_events:
+                self._scheduled_events_total += 1
+            room_events[event.event_type] = cancel_callback
             
             _LOGGER.debug(
                 "Scheduled %s event for room %s at %s", 
@@ -390,11 +653,23 @@ class IrrigationCoordinator(DataUpdateCoordinator):
 
     async def _cancel_room_scheduled_events(self, room_id: str) -> None:
         """Cancel scheduled events for a specific room."""
-        if room_id in self._scheduled_events:
-            for event_type, cancel_callback in self._scheduled_events[room_id].items():
+        self._invalidate_cron_cache(room_id)
+        room_events = self._scheduled_events.pop(room_id, None)
+        if room_events:
+            for event_type, cancel_callback in room_events.items():
                 if cancel_callback:
                     cancel_callback()
-            del self._scheduled_events[room_id]
+            self._scheduled_events_total -= len(room_events)
+
+    def _invalidate_cron_cache(self, room_id: str) -> None:
+        """Drop parsed cron expressions for a room."""
+        for key in [key for key in self._cron_cache if key[0] == room_id]:
+            del self._cron_cache[key]
+
+    @callback
+    def _scheduled_event_callback(self, room_id: str, event: IrrigationEvent, now: datetime) -> None:
+        """Start a scheduled irrigation event when its time arrives."""
+        self.hass.async_create_task(self._execute_scheduled_event(room_id, event), **_EAGER_TASK_KWARGS)
 
     async def _execute_scheduled_event(self, room_id: str, event: IrrigationEvent) -> None:
         """Execute a scheduled irrigation event."""
@@ -413,9 +688,9 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 # Update last run time
                 event.last_run = dt_util.now()
                 
-                # Save updated room data
-                room = self._rooms[room_id]
-                await self.storage.async_save_room(room)
+                # Persist with the next batched room write
+                self._dirty_rooms.add(room_id)
+                self._schedule_room_flush()
             
             # Reschedule the event for next occurrence
             await self._schedule_event(room_id, event)
@@ -429,24 +704,67 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             except Exception as reschedule_error:
                 _LOGGER.error("Failed to reschedule event: %s", reschedule_error)
 
+    @callback
+    def _schedule_room_flush(self) -> None:
+        """Schedule a storage write for rooms changed by scheduled runs."""
+        if self._room_flush_cancel is None:
+            self._room_flush_cancel = async_call_later(
+                self.hass, _ROOM_FLUSH_DELAY, self._async_flush_dirty_rooms
+            )
+
+    async def _async_flush_on_stop(self, event: Event) -> None:
+        """Write out pending room changes when Home Assistant stops."""
+        self._stop_listener_cancel = None
+        await self._async_flush_pending_rooms()
+
+    async def _async_flush_pending_rooms(self) -> None:
+        """Cancel the batched room write and save pending changes now."""
+        if self._room_flush_cancel is not None:
+            self._room_flush_cancel()
+            self._room_flush_cancel = None
+        await self._async_flush_dirty_rooms()
+
+    async def _async_flush_dirty_rooms(self, now: Optional[datetime] = None) -> None:
+        """Save all rooms changed since the last flush in one write."""
+        self._room_flush_cancel = None
+        rooms = [self._rooms[room_id] for room_id in self._dirty_rooms if room_id in self._rooms]
+        self._dirty_rooms.clear()
+        if not rooms:
+            return
+        
+        try:
+            await self.storage.async_save_rooms(rooms)
+        except Exception as e:
+            _LOGGER.error("Failed to save updated rooms: %s", e)
+
     def _schedule_daily_reset(self) -> None:
-        """Schedule daily reset of irrigation totals."""
-        # Schedule reset at midnight
-        next_midnight = dt_util.now().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) + timedelta(days=1)
+        """Schedule daily reset of irrigation totals, replacing any pending one."""
+        if self._daily_reset_cancel is not None:
+            self._daily_reset_cancel()
+            if self._daily_reset_cancel in self._event_listeners:
+                self._event_listeners.remove(self._daily_reset_cancel)
+            self._daily_reset_cancel = None
+        
+        # Schedule reset at midnight as a loop-clock delay. The delay is taken
+        # on epoch time: subtracting datetimes in the same time zone compares
+        # wall clocks and would be an hour off across a DST change.
+        next_midnight = dt_util.start_of_local_day(dt_util.now().date() + timedelta(days=1))
         
-        cancel_callback = async_track_point_in_time(
+        cancel_callback = async_call_later(
             self.hass,
-            self._daily_reset_callback,
-            next_midnight
+            max(next_midnight.timestamp() - time.time(), 0),
+            self._daily_reset_callback
         )
         
-        self._event_listeners.add(cancel_callback)
+        self._daily_reset_cancel = cancel_callback
+        self._event_listeners.append(cancel_callback)
 
     @callback
     def _daily_reset_callback(self, now: datetime) -> None:
         """Callback for daily reset."""
+        if self._daily_reset_cancel in self._event_listeners:
+            self._event_listeners.remove(self._daily_reset_cancel)
+        self._daily_reset_cancel = None
         self._reset_daily_totals()
         # Schedule next day's reset
         self._schedule_daily_reset()
@@ -460,37 +778,43 @@ class IrrigationCoordinator(DataUpdateCoordinator):
     
     def get_room_status(self, room_id: str) -> Dict[str, Any]:
         """Get current status for a room."""
+        irrigation_state = self._active_irrigations.get(room_id)
+        manual_state = self._manual_runs.get(room_id)
+        
+        # Collect next and last run times in one pass over the enabled events
+        next_events: Dict[str, Optional[datetime]] = {}
+        last_events: Dict[str, Optional[datetime]] = {}
+        for event in self._enabled_events_by_room.get(room_id, ()):
+            next_events[event.event_type] = event.next_run
+            last_events[event.event_type] = event.last_run
+        
         status = {
-            "active_irrigation": room_id in self._active_irrigations,
-            "manual_run": room_id in self._manual_runs,
+            "active_irrigation": irrigation_state is not None,
+            "manual_run": manual_state is not None,
             "daily_total": self._daily_irrigation_totals.get(room_id, 0),
-            "next_events": {},
-            "last_events": {}
+            "next_events": next_events,
+            "last_events": last_events
         }
         
-        # Get next and last event times
-        if room_id in self._rooms:
-            room = self._rooms[room_id]
-            for event in room.events:
-                if event.enabled:
-                    status["next_events"][event.event_type] = event.next_run
-                    status["last_events"][event.event_type] = event.last_run
-        
         # Add active irrigation details
-        if room_id in self._active_irrigations:
-            irrigation_state = self._active_irrigations[room_id]
+        if irrigation_state is not None:
+            # Convert the monotonic shot start to wall-clock time only when asked
+            shot_start_time = None
+            if irrigation_state.shot_start_monotonic is not None:
+                elapsed = time.monotonic() - irrigation_state.shot_start_monotonic
+                shot_start_time = dt_util.now() - timedelta(seconds=elapsed)
+            
             status["active_irrigation_details"] = {
-                "event_type": irrigation_state.get("event_type"),
-                "current_shot": irrigation_state.get("current_shot", 0),
-                "total_shots": irrigation_state.get("total_shots", 0),
-                "shot_start_time": irrigation_state.get("shot_start_time"),
-                "shot_duration": irrigation_state.get("shot_duration", 0),
-                "progress": irrigation_state.get("progress", 0)
+                "event_type": irrigation_state.event_type,
+                "current_shot": irrigation_state.current_shot,
+                "total_shots": irrigation_state.total_shots,
+                "shot_start_time": shot_start_time,
+                "shot_duration": irrigation_state.shot_duration,
+                "progress": irrigation_state.progress
             }
         
         # Add manual run details
-        if room_id in self._manual_runs:
-            manual_state = self._manual_runs[room_id]
+        if manual_state is not None:
             status["manual_run_details"] = {
                 "start_time": manual_state.get("start_time"),
                 "duration": manual_state.get("duration", 0),
@@ -535,18 +859,18 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Perform fail-safe checks
             fail_safe_result = await self._check_fail_safes(room_id, event.get_total_duration())
-            if not fail_safe_result["allowed"]:
+            if not fail_safe_result.allowed:
                 _LOGGER.warning(
                     "Fail-safe check failed for room %s: %s", 
-                    room_id, fail_safe_result["reason"]
+                    room_id, fail_safe_result.reason
                 )
                 await self.storage.async_add_history_event(
-                    room_id, event_type, 0, False, fail_safe_result["reason"]
+                    room_id, event_type, 0, False, fail_safe_result.reason
                 )
                 
                 # Send error notification for fail-safe issues
                 await self.send_error_notification(
-                    f"Irrigation blocked by fail-safe: {fail_safe_result['reason']}", room_id
+                    f"Irrigation blocked by fail-safe: {fail_safe_result.reason}", room_id
                 )
                 
                 return False
@@ -555,19 +879,14 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Starting %s irrigation for room %s", event_type, room_id)
             
             # Initialize irrigation state
-            irrigation_state = {
-                "event_type": event_type,
-                "shots": event.shots,
-                "current_shot": 0,
-                "total_shots": len(event.shots),
-                "start_time": dt_util.now(),
-                "shot_start_time": None,
-                "shot_duration": 0,
-                "progress": 0,
-                "total_duration": event.get_total_duration()
-            }
-            
-            self._active_irrigations[room_id] = irrigation_state
+            self._active_irrigations[room_id] = ActiveIrrigation(
+                event_type=event_type,
+                shots=event.shots,
+                total_shots=len(event.shots),
+                start_time=dt_util.now(),
+                total_duration=event.get_total_duration()
+            )
+            self._async_start_progress_updates()
             
             # Execute shots sequentially
             success = await self._execute_irrigation_shots(room_id, event.shots)
@@ -579,9 +898,7 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             # Update daily totals
             if success:
                 actual_duration = event.get_total_duration()
-                self._daily_irrigation_totals[room_id] = (
-                    self._daily_irrigation_totals.get(room_id, 0) + actual_duration
-                )
+                self._daily_irrigation_totals[room_id] += actual_duration
             
             # Add to history
             await self.storage.async_add_history_event(
@@ -591,8 +908,8 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             # Record performance metrics
             await self.storage.async_record_irrigation_cycle(success, event.get_total_duration())
             
-            # Trigger data update
-            await self.async_request_refresh()
+            # Notify listeners without polling every room's sensors
+            self._async_publish_changes()
             
             _LOGGER.info(
                 "Irrigation %s for room %s: %s", 
@@ -628,28 +945,43 @@ class IrrigationCoordinator(DataUpdateCoordinator):
         try:
             room = self._rooms[room_id]
             irrigation_state = self._active_irrigations[room_id]
+            total_shots = len(shots)
+            last_shot = total_shots - 1
+            
+            # Pump stabilization delay applies to the whole event
+            pump_delay = self._settings.get("pump_zone_delay", DEFAULT_PUMP_ZONE_DELAY)
+            
+            # Gaps shorter than a pump restart (stop + stabilization) keep the pump running
+            pump_restart_threshold = pump_delay * 2
+            pump_running = False
             
             for i, shot in enumerate(shots):
                 # Update current shot info
-                irrigation_state["current_shot"] = i
-                irrigation_state["shot_start_time"] = dt_util.now()
-                irrigation_state["shot_duration"] = shot.duration
-                irrigation_state["progress"] = i / len(shots)
+                irrigation_state.current_shot = i
+                irrigation_state.shot_start_monotonic = time.monotonic()
+                irrigation_state.shot_duration = shot.duration
+                irrigation_state.progress = i / total_shots
                 
                 _LOGGER.debug(
                     "Executing shot %d/%d for room %s (duration: %ds)", 
-                    i + 1, len(shots), room_id, shot.duration
+                    i + 1, total_shots, room_id, shot.duration
                 )
                 
-                # Start pump and zones
-                pump_success = await self._activate_pump(room_id, room.pump_entity)
-                if not pump_success:
-                    _LOGGER.error("Failed to activate pump for room %s", room_id)
-                    return False
+                # Start pump unless it kept running from the previous shot
+                if not pump_running:
+                    pump_success = await self._activate_pump(room_id, room.pump_entity)
+                    if not pump_success:
+                        _LOGGER.error("Failed to activate pump for room %s", room_id)
+                        return False
+                    pump_running = True
+                    
+                    # Wait for pump stabilization (3-second delay)
+                    if await self._async_wait_for_stop(irrigation_state, pump_delay):
+                        return await self._async_stopped_externally(room_id, room)
                 
-                # Wait for pump stabilization (3-second delay)
-                pump_delay = self._settings.get("pump_zone_delay", 3)
-                await asyncio.sleep(pump_delay)
+                # A stop may have switched the room off while the pump was starting
+                if irrigation_state.stop_event.is_set():
+                    return await self._async_stopped_externally(room_id, room)
                 
                 # Activate zones
                 zones_success = await self._activate_zones(room_id, room.zone_entities)
@@ -660,29 +992,28 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                     return False
                 
                 # Run shot for specified duration
-                await asyncio.sleep(shot.duration)
+                if await self._async_wait_for_stop(irrigation_state, shot.duration):
+                    return await self._async_stopped_externally(room_id, room)
                 
                 # Deactivate zones first
                 await self._deactivate_zones(room_id, room.zone_entities)
                 
-                # Deactivate pump
-                await self._deactivate_pump(room_id, room.pump_entity)
+                # Deactivate pump unless the next shot follows shortly
+                if i == last_shot or shot.interval_after >= pump_restart_threshold:
+                    await self._deactivate_pump(room_id, room.pump_entity)
+                    pump_running = False
                 
                 # Wait for interval before next shot (if not last shot)
-                if i < len(shots) - 1 and shot.interval_after > 0:
+                if i < last_shot and shot.interval_after > 0:
                     _LOGGER.debug(
                         "Waiting %ds before next shot for room %s", 
                         shot.interval_after, room_id
                     )
-                    await asyncio.sleep(shot.interval_after)
-                
-                # Check if irrigation was stopped externally
-                if room_id not in self._active_irrigations:
-                    _LOGGER.info("Irrigation stopped externally for room %s", room_id)
-                    return False
+                    if await self._async_wait_for_stop(irrigation_state, shot.interval_after):
+                        return await self._async_stopped_externally(room_id, room)
             
             # Update final progress
-            irrigation_state["progress"] = 1.0
+            irrigation_state.progress = 1.0
             
             return True
             
@@ -691,14 +1022,31 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Emergency cleanup - turn off all devices
             try:
-                room = self._rooms[room_id]
-                await self._deactivate_zones(room_id, room.zone_entities)
-                await self._deactivate_pump(room_id, room.pump_entity)
+                await self._async_deactivate_room(room_id, self._rooms[room_id])
             except Exception as cleanup_error:
                 _LOGGER.error("Error during emergency cleanup: %s", cleanup_error)
             
             return False
 
+    async def _async_stopped_externally(self, room_id: str, room: Room) -> bool:
+        """Turn the room off after a stop request and report the run as not completed.
+
+        The stop handler already switches the room off, but zones activated
+        after that point would otherwise stay open.
+        """
+        _LOGGER.info("Irrigation stopped externally for room %s", room_id)
+        await self._async_deactivate_room(room_id, room)
+        return False
+
+    @staticmethod
+    async def _async_wait_for_stop(irrigation_state: ActiveIrrigation, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds, returning True if the irrigation was stopped."""
+        try:
+            await asyncio.wait_for(irrigation_state.stop_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def async_start_manual_run(self, room_id: str, duration: int) -> bool:
         """Start a manual irrigation run."""
         try:
@@ -718,10 +1066,10 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Perform fail-safe checks
             fail_safe_result = await self._check_fail_safes(room_id, duration)
-            if not fail_safe_result["allowed"]:
+            if not fail_safe_result.allowed:
                 _LOGGER.warning(
                     "Fail-safe check failed for manual run on room %s: %s", 
-                    room_id, fail_safe_result["reason"]
+                    room_id, fail_safe_result.reason
                 )
                 return False
             
@@ -732,11 +1080,13 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             # Initialize manual run state
             manual_state = {
                 "start_time": dt_util.now(),
+                "start_monotonic": time.monotonic(),
                 "duration": duration,
                 "remaining": duration
             }
             
             self._manual_runs[room_id] = manual_state
+            self._async_start_progress_updates()
             
             # Start pump and zones
             pump_success = await self._activate_pump(room_id, room.pump_entity)
@@ -744,41 +1094,41 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 del self._manual_runs[room_id]
                 return False
             
+            # Check zone availability before waiting out pump stabilization
+            available_zones = self._get_available_zones(room.zone_entities)
+            
             # Wait for pump stabilization
-            pump_delay = self._settings.get("pump_zone_delay", 3)
+            pump_delay = self._settings.get("pump_zone_delay", DEFAULT_PUMP_ZONE_DELAY)
             await asyncio.sleep(pump_delay)
             
             # Activate zones
-            zones_success = await self._activate_zones(room_id, room.zone_entities)
+            zones_success = not room.zone_entities or await self._async_turn_on_zones(
+                room_id, available_zones
+            )
             if not zones_success:
                 await self._deactivate_pump(room_id, room.pump_entity)
                 del self._manual_runs[room_id]
                 return False
             
             # Schedule automatic stop
-            stop_time = dt_util.now() + timedelta(seconds=duration)
-            cancel_callback = async_track_point_in_time(
+            cancel_callback = async_call_later(
                 self.hass,
-                lambda dt: self.hass.async_create_task(
-                    self.async_stop_manual_run(room_id)
-                ),
-                stop_time
+                duration,
+                partial(self._async_manual_run_timeout, room_id)
             )
             
             manual_state["cancel_callback"] = cancel_callback
             
             # Update daily totals
-            self._daily_irrigation_totals[room_id] = (
-                self._daily_irrigation_totals.get(room_id, 0) + duration
-            )
+            self._daily_irrigation_totals[room_id] += duration
             
             # Add to history
             await self.storage.async_add_history_event(
                 room_id, "manual", duration, True
             )
             
-            # Trigger data update
-            await self.async_request_refresh()
+            # Notify listeners without polling every room's sensors
+            self._async_publish_changes()
             
             return True
             
@@ -791,8 +1141,16 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             return False
 
-    async def async_stop_manual_run(self, room_id: str) -> bool:
-        """Stop a manual irrigation run."""
+    async def _async_manual_run_timeout(self, room_id: str, now: datetime) -> None:
+        """Stop a manual run once its duration has elapsed."""
+        await self.async_stop_manual_run(room_id)
+
+    async def async_stop_manual_run(self, room_id: str, *, publish: bool = True) -> bool:
+        """Stop a manual irrigation run.
+        
+        Callers that stop several runs pass publish=False and notify listeners
+        once themselves.
+        """
         try:
             if room_id not in self._manual_runs:
                 _LOGGER.warning("No manual run active for room %s", room_id)
@@ -808,14 +1166,14 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 manual_state["cancel_callback"]()
             
             # Deactivate zones and pump
-            await self._deactivate_zones(room_id, room.zone_entities)
-            await self._deactivate_pump(room_id, room.pump_entity)
+            await self._async_deactivate_room(room_id, room)
             
             # Clean up state
             del self._manual_runs[room_id]
             
-            # Trigger data update
-            await self.async_request_refresh()
+            if publish:
+                # Notify listeners without polling every room's sensors
+                self._async_publish_changes()
             
             return True
             
@@ -823,33 +1181,33 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error stopping manual run for room %s: %s", room_id, e)
             return False
 
-    async def async_stop_irrigation(self, room_id: str) -> bool:
+    async def async_stop_irrigation(self, room_id: str, *, publish: bool = True) -> bool:
         """Stop any active irrigation for a room."""
         try:
             stopped = False
             
             # Stop manual run if active
             if room_id in self._manual_runs:
-                await self.async_stop_manual_run(room_id)
+                await self.async_stop_manual_run(room_id, publish=False)
                 stopped = True
             
             # Stop scheduled irrigation if active
-            if room_id in self._active_irrigations:
+            irrigation_state = self._active_irrigations.pop(room_id, None)
+            if irrigation_state is not None:
                 room = self._rooms[room_id]
                 
-                # Emergency stop - turn off all devices
-                await self._deactivate_zones(room_id, room.zone_entities)
-                await self._deactivate_pump(room_id, room.pump_entity)
+                # Wake the shot loop so it stops waiting out the current shot
+                irrigation_state.stop_event.set()
                 
-                # Clean up state
-                del self._active_irrigations[room_id]
+                # Emergency stop - turn off all devices
+                await self._async_deactivate_room(room_id, room)
                 
                 _LOGGER.info("Stopped active irrigation for room %s", room_id)
                 stopped = True
             
-            if stopped:
-                # Trigger data update
-                await self.async_request_refresh()
+            if stopped and publish:
+                # Notify listeners without polling every room's sensors
+                self._async_publish_changes()
             
             return stopped
             
@@ -895,6 +1253,22 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to deactivate pump %s: %s", pump_entity, e)
             return False
 
+    async def _async_deactivate_room(self, room_id: str, room: Room) -> bool:
+        """Turn off a room's zones and pump, returning True if both turned off.
+
+        The zones and pump are separate switches, so both calls are issued
+        at once: a slow or failing zone call never delays the pump shutoff.
+        """
+        results = await asyncio.gather(
+            self._deactivate_zones(room_id, room.zone_entities),
+            self._deactivate_pump(room_id, room.pump_entity),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to turn off room %s: %s", room_id, result)
+        return all(result is True for result in results)
+
     async def _activate_zones(self, room_id: str, zone_entities: List[str]) -> bool:
         """Activate all zones for a room."""
         try:
@@ -902,221 +1276,201 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("No zones configured for room %s", room_id)
                 return True
             
-            success_count = 0
-            
-            for zone_entity in zone_entities:
-                # Check entity availability
-                state = self.hass.states.get(zone_entity)
-                if not state or state.state == "unavailable":
-                    _LOGGER.warning("Zone entity %s is unavailable", zone_entity)
-                    continue
-                
-                try:
-                    # Turn on zone
-                    await self.hass.services.async_call(
-                        "switch", "turn_on", {"entity_id": zone_entity}
-                    )
-                    success_count += 1
-                    _LOGGER.debug("Activated zone %s for room %s", zone_entity, room_id)
-                    
-                except Exception as e:
-                    _LOGGER.error("Failed to activate zone %s: %s", zone_entity, e)
-            
-            # Consider success if at least one zone activated
-            return success_count > 0
+            return await self._async_turn_on_zones(room_id, self._get_available_zones(zone_entities))
             
         except Exception as e:
             _LOGGER.error("Failed to activate zones for room %s: %s", room_id, e)
             return False
 
+    def _get_available_zones(self, zone_entities: List[str]) -> List[str]:
+        """Return the zone entities that can currently be switched."""
+        available_zones = []
+        for zone_entity in zone_entities:
+            # Check entity availability
+            state = self.hass.states.get(zone_entity)
+            if not state or state.state == "unavailable":
+                _LOGGER.warning("Zone entity %s is unavailable", zone_entity)
+                continue
+            available_zones.append(zone_entity)
+        return available_zones
+
+    async def _async_turn_on_zones(self, room_id: str, available_zones: List[str]) -> bool:
+        """Turn on already checked zones with one service call."""
+        # Consider success if at least one zone is available
+        if not available_zones:
+            return False
+        
+        try:
+            await self.hass.services.async_call(
+                "switch", "turn_on", {"entity_id": available_zones}
+            )
+        except Exception as e:
+            _LOGGER.error("Failed to activate zones for room %s: %s", room_id, e)
+            return False
+        
+        _LOGGER.debug("Activated zones %s for room %s", available_zones, room_id)
+        return True
+
     async def _deactivate_zones(self, room_id: str, zone_entities: List[str]) -> bool:
         """Deactivate all zones for a room."""
         try:
             if not zone_entities:
                 return True
             
-            for zone_entity in zone_entities:
-                try:
-                    # Turn off zone
-                    await self.hass.services.async_call(
-                        "switch", "turn_off", {"entity_id": zone_entity}
-                    )
-                    _LOGGER.debug("Deactivated zone %s for room %s", zone_entity, room_id)
-                    
-                except Exception as e:
-                    _LOGGER.error("Failed to deactivate zone %s: %s", zone_entity, e)
+            # Turn off all zones with one service call
+            await self.hass.services.async_call(
+                "switch", "turn_off", {"entity_id": zone_entities}
+            )
             
+            _LOGGER.debug("Deactivated zones %s for room %s", zone_entities, room_id)
             return True
             
         except Exception as e:
             _LOGGER.error("Failed to deactivate zones for room %s: %s", room_id, e)
-            return False 
-   # Fail-Safe and Safety Mechanisms
-    
-    async def _check_fail_safes(self, room_id: str, duration: int) -> Dict[str, Any]:
+            return False
+
+    async def _check_fail_safes(self, room_id: str, duration: int) -> CheckResult:
         """Check all fail-safe conditions before allowing irrigation."""
+        # Check if fail-safes are enabled before setting up error handling
+        if not self._settings.get("fail_safe_enabled", DEFAULT_FAIL_SAFE_ENABLED):
+            self.irrigation_logger.debug("Fail-safes disabled, allowing irrigation", room_id=room_id)
+            return _ALLOW
+        
         with IrrigationErrorHandler("fail_safe_check", self.irrigation_logger, suppress_exceptions=True):
-            result = {"allowed": True, "reason": ""}
-            
             try:
-                # Check if fail-safes are enabled
-                if not self._settings.get("fail_safe_enabled", True):
-                    self.irrigation_logger.debug("Fail-safes disabled, allowing irrigation", room_id=room_id)
-                    return result
-                
                 room = self._rooms.get(room_id)
                 if not room:
-                    error_result = {"allowed": False, "reason": "Room not found"}
+                    error_result = CheckResult(False, "Room not found")
                     self.irrigation_logger.fail_safe_trigger(room_id, "Room not found", "room_existence")
                     return error_result
                 
+                # Look up every entity the checks need once
+                get_state = self.hass.states.get
+                states = {
+                    entity_id: get_state(entity_id)
+                    for entity_id in (room.pump_entity, *room.zone_entities, room.light_entity)
+                    if entity_id
+                }
+                
                 # Check light schedule integration
-                light_check = await self._check_light_schedule(room_id, room)
-                if not light_check["allowed"]:
+                light_check = await self._check_light_schedule(room_id, room, states)
+                if not light_check.allowed:
                     self.irrigation_logger.fail_safe_trigger(
-                        room_id, light_check["reason"], "light_schedule",
+                        room_id, light_check.reason, "light_schedule",
                         light_entity=room.light_entity
                     )
                     return light_check
                 
                 # Check entity availability
-                entity_check = await self._check_entity_availability(room_id, room)
-                if not entity_check["allowed"]:
+                entity_check = await self._check_entity_availability(room_id, room, states)
+                if not entity_check.allowed:
                     self.irrigation_logger.fail_safe_trigger(
-                        room_id, entity_check["reason"], "entity_availability"
+                        room_id, entity_check.reason, "entity_availability"
                     )
                     return entity_check
                 
                 # Check over-watering prevention
                 overwater_check = await self._check_overwatering_prevention(room_id, duration)
-                if not overwater_check["allowed"]:
+                if not overwater_check.allowed:
                     self.irrigation_logger.fail_safe_trigger(
-                        room_id, overwater_check["reason"], "overwatering_prevention",
+                        room_id, overwater_check.reason, "overwatering_prevention",
                         current_total=self._daily_irrigation_totals.get(room_id, 0),
                         requested_duration=duration
                     )
                     return overwater_check
                 
                 # Check for conflicting irrigations
-                conflict_check = self._check_irrigation_conflicts(room_id)
-                if not conflict_check["allowed"]:
+                conflict_reason = None
+                if room_id in self._active_irrigations:
+                    conflict_reason = "Scheduled irrigation already active for this room"
+                elif room_id in self._manual_runs:
+                    conflict_reason = "Manual irrigation run already active for this room"
+                if conflict_reason:
                     self.irrigation_logger.fail_safe_trigger(
-                        room_id, conflict_check["reason"], "irrigation_conflict"
+                        room_id, conflict_reason, "irrigation_conflict"
                     )
-                    return conflict_check
+                    return CheckResult(False, conflict_reason)
                 
                 self.irrigation_logger.debug("All fail-safe checks passed", room_id=room_id)
-                return result
+                return _ALLOW
                 
             except Exception as e:
                 self._record_error("fail_safe_check", e, room_id=room_id)
-                error_result = {"allowed": False, "reason": f"Fail-safe check error: {e}"}
+                error_result = CheckResult(False, f"Fail-safe check error: {e}")
                 self.irrigation_logger.fail_safe_trigger(
                     room_id, f"Check error: {e}", "system_error", error=str(e)
                 )
                 return error_result
 
-    async def _check_light_schedule(self, room_id: str, room: Room) -> Dict[str, Any]:
+    async def _check_light_schedule(
+        self, room_id: str, room: Room, states: Mapping[str, Any]
+    ) -> CheckResult:
         """Check light schedule integration and validation."""
         try:
             # Skip if no light entity configured
             if not room.light_entity:
-                return {"allowed": True, "reason": ""}
+                return _ALLOW
             
             # Get light entity state
-            light_state = self.hass.states.get(room.light_entity)
+            light_state = states.get(room.light_entity)
             if not light_state:
                 _LOGGER.warning("Light entity %s not found for room %s", room.light_entity, room_id)
-                return {"allowed": True, "reason": ""}  # Allow if light entity missing
+                return _ALLOW  # Allow if light entity missing
             
             if light_state.state == "unavailable":
-                return {
-                    "allowed": False, 
-                    "reason": f"Light entity {room.light_entity} is unavailable"
-                }
+                return CheckResult(False, f"Light entity {room.light_entity} is unavailable")
             
             # Check if lights are on (irrigation should only happen when lights are on)
             if light_state.state == "off":
-                return {
-                    "allowed": False,
-                    "reason": "Irrigation blocked: lights are off (light schedule conflict)"
-                }
+                return CheckResult(False, "Irrigation blocked: lights are off (light schedule conflict)")
             
-            return {"allowed": True, "reason": ""}
+            return _ALLOW
             
         except Exception as e:
             _LOGGER.error("Error checking light schedule for room %s: %s", room_id, e)
-            return {"allowed": False, "reason": f"Light schedule check error: {e}"}
+            return CheckResult(False, f"Light schedule check error: {e}")
 
-    async def _check_entity_availability(self, room_id: str, room: Room) -> Dict[str, Any]:
+    async def _check_entity_availability(
+        self, room_id: str, room: Room, states: Mapping[str, Any]
+    ) -> CheckResult:
         """Check availability of all required entities before irrigation."""
         try:
-            unavailable_entities = []
-            
-            # Check pump entity
-            pump_state = self.hass.states.get(room.pump_entity)
-            if not pump_state or pump_state.state == "unavailable":
-                unavailable_entities.append(f"pump: {room.pump_entity}")
+            # Stop at the first unavailable entity; the full list is reported
+            # by async_validate_room_safety
+            unavailable_entity = self._first_unavailable_entity(room, states)
+            if unavailable_entity:
+                return CheckResult(False, f"Unavailable entities: {unavailable_entity}")
             
-            # Check zone entities
-            for zone_entity in room.zone_entities:
-                zone_state = self.hass.states.get(zone_entity)
-                if not zone_state or zone_state.state == "unavailable":
-                    unavailable_entities.append(f"zone: {zone_entity}")
-            
-            if unavailable_entities:
-                return {
-                    "allowed": False,
-                    "reason": f"Unavailable entities: {', '.join(unavailable_entities)}"
-                }
-            
-            return {"allowed": True, "reason": ""}
+            return _ALLOW
             
         except Exception as e:
             _LOGGER.error("Error checking entity availability for room %s: %s", room_id, e)
-            return {"allowed": False, "reason": f"Entity availability check error: {e}"}
+            return CheckResult(False, f"Entity availability check error: {e}")
 
-    async def _check_overwatering_prevention(self, room_id: str, duration: int) -> Dict[str, Any]:
-        """Check over-watering prevention with daily limits."""
-        try:
-            max_daily = self._settings.get("max_daily_irrigation", 3600)  # Default 1 hour
-            current_daily = self._daily_irrigation_totals.get(room_id, 0)
-            
-            if current_daily + duration > max_daily:
-                remaining = max_daily - current_daily
-                return {
-                    "allowed": False,
-                    "reason": f"Daily irrigation limit exceeded. Remaining: {remaining}s of {max_daily}s"
-                }
-            
-            return {"allowed": True, "reason": ""}
-            
-        except Exception as e:
-            _LOGGER.error("Error checking overwatering prevention for room %s: %s", room_id, e)
-            return {"allowed": False, "reason": f"Overwatering check error: {e}"}
+    @staticmethod
+    def _first_unavailable_entity(room: Room, states: Mapping[str, Any]) -> Optional[str]:
+        """Return the first pump or zone entity that is missing or unavailable."""
+        pump_state = states.get(room.pump_entity)
+        if not pump_state or pump_state.state == "unavailable":
+            return f"pump: {room.pump_entity}"
+        
+        for zone_entity in room.zone_entities:
+            zone_state = states.get(zone_entity)
+            if not zone_state or zone_state.state == "unavailable":
+                return f"zone: {zone_entity}"
+        
+        return None
 
-    def _check_irrigation_conflicts(self, room_id: str) -> Dict[str, Any]:
-        """Check for conflicting irrigation activities."""
-        try:
-            # Check if irrigation is already active
-            if room_id in self._active_irrigations:
-                return {
-                    "allowed": False,
-                    "reason": "Scheduled irrigation already active for this room"
-                }
-            
-            # Check if manual run is active
-            if room_id in self._manual_runs:
-                return {
-                    "allowed": False,
-                    "reason": "Manual irrigation run already active for this room"
-                }
-            
-            return {"allowed": True, "reason": ""}
-            
-        except Exception as e:
-            _LOGGER.error("Error checking irrigation conflicts for room %s: %s", room_id, e)
-            return {"allowed": False, "reason": f"Conflict check error: {e}"}
+    async def _check_overwatering_prevention(self, room_id: str, duration: int) -> CheckResult:
+        """Check over-watering prevention with daily limits."""
+        max_daily = self._settings.get("max_daily_irrigation", DEFAULT_MAX_DAILY_IRRIGATION)
+        current_daily = self._daily_irrigation_totals.get(room_id, 0)
+        
+        if current_daily + duration > max_daily:
+            remaining = max_daily - current_daily
+            return CheckResult(False, f"Daily irrigation limit exceeded. Remaining: {remaining}s of {max_daily}s")
+        
+        return _ALLOW
 
     async def async_emergency_stop_all(self) -> Dict[str, bool]:
         """Emergency stop all irrigation activities."""
@@ -1127,21 +1481,19 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             # Stop all active irrigations
             for room_id in list(self._active_irrigations.keys()):
-                results[f"{room_id}_irrigation"] = await self.async_stop_irrigation(room_id)
+                results[f"{room_id}_irrigation"] = await self.async_stop_irrigation(room_id, publish=False)
             
             # Stop all manual runs
             for room_id in list(self._manual_runs.keys()):
-                results[f"{room_id}_manual"] = await self.async_stop_manual_run(room_id)
+                results[f"{room_id}_manual"] = await self.async_stop_manual_run(room_id, publish=False)
             
-            # Turn off all pumps and zones as safety measure
-            for room_id, room in self._rooms.items():
-                try:
-                    await self._deactivate_zones(room_id, room.zone_entities)
-                    await self._deactivate_pump(room_id, room.pump_entity)
-                    results[f"{room_id}_safety_shutoff"] = True
-                except Exception as e:
-                    _LOGGER.error("Failed safety shutoff for room %s: %s", room_id, e)
-                    results[f"{room_id}_safety_shutoff"] = False
+            # Turn off all pumps and zones as safety measure, all rooms at once
+            room_ids = list(self._rooms)
+            shutoff_results = await asyncio.gather(
+                *(self._async_safety_shutoff(room_id, self._rooms[room_id]) for room_id in room_ids)
+            )
+            for room_id, shutoff_result in zip(room_ids, shutoff_results):
+                results[f"{room_id}_safety_shutoff"] = shutoff_result
             
             # Trigger data update
             await self.async_request_refresh()
@@ -1153,6 +1505,13 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error during emergency stop: %s", e)
             return {"error": False}
 
+    async def _async_safety_shutoff(self, room_id: str, room: Room) -> bool:
+        """Turn off a room's zones and pump, reporting whether it succeeded."""
+        if await self._async_deactivate_room(room_id, room):
+            return True
+        _LOGGER.error("Failed safety shutoff for room %s", room_id)
+        return False
+
     async def async_emergency_stop_room(self, room_id: str) -> bool:
         """Emergency stop for a specific room."""
         try:
@@ -1163,12 +1522,11 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             
             room = self._rooms[room_id]
             
-            # Stop any active irrigation
-            await self.async_stop_irrigation(room_id)
+            # Stop any active irrigation; the refresh below notifies listeners
+            await self.async_stop_irrigation(room_id, publish=False)
             
             # Safety shutoff - turn off all devices
-            await self._deactivate_zones(room_id, room.zone_entities)
-            await self._deactivate_pump(room_id, room.pump_entity)
+            await self._async_deactivate_room(room_id, room)
             
             # Trigger data update
             await self.async_request_refresh()
@@ -1183,10 +1541,10 @@ class IrrigationCoordinator(DataUpdateCoordinator):
     def get_fail_safe_status(self) -> Dict[str, Any]:
         """Get current fail-safe system status."""
         return {
-            "enabled": self._settings.get("fail_safe_enabled", True),
-            "emergency_stop_enabled": self._settings.get("emergency_stop_enabled", True),
-            "max_daily_irrigation": self._settings.get("max_daily_irrigation", 3600),
-            "daily_totals": self._daily_irrigation_totals.copy(),
+            "enabled": self._settings.get("fail_safe_enabled", DEFAULT_FAIL_SAFE_ENABLED),
+            "emergency_stop_enabled": self._settings.get("emergency_stop_enabled", DEFAULT_EMERGENCY_STOP_ENABLED),
+            "max_daily_irrigation": self._settings.get("max_daily_irrigation", DEFAULT_MAX_DAILY_IRRIGATION),
+            "daily_totals": dict(self._daily_irrigation_totals),
             "active_irrigations": len(self._active_irrigations),
             "active_manual_runs": len(self._manual_runs)
         }
@@ -1214,7 +1572,7 @@ class IrrigationCoordinator(DataUpdateCoordinator):
         
         # Check daily limits
         current_daily = self._daily_irrigation_totals.get(room_id, 0)
-        max_daily = self._settings.get("max_daily_irrigation", 3600)
+        max_daily = self._settings.get("max_daily_irrigation", DEFAULT_MAX_DAILY_IRRIGATION)
         if current_daily >= max_daily:
             issues.append(f"Daily irrigation limit reached: {current_daily}/{max_daily}s")
         
@@ -1236,29 +1594,28 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             "rooms_count": len(self._rooms),
             "active_irrigations": len(self._active_irrigations),
             "active_manual_runs": len(self._manual_runs),
-            "scheduled_events": sum(len(events) for events in self._scheduled_events.values()),
-            "fail_safe_enabled": self._settings.get("fail_safe_enabled", True),
-            "daily_totals": self._daily_irrigation_totals.copy()
+            "scheduled_events": self._scheduled_events_total,
+            "fail_safe_enabled": self._settings.get("fail_safe_enabled", DEFAULT_FAIL_SAFE_ENABLED),
+            "daily_totals": dict(self._daily_irrigation_totals)
         }
         
         # Check for issues
         issues = []
         
         # Check for long-running irrigations
-        now = dt_util.now()
+        now = time.monotonic()
         for room_id, irrigation_state in self._active_irrigations.items():
-            start_time = irrigation_state.get("start_time")
-            if start_time and (now - start_time).total_seconds() > 7200:  # 2 hours
+            if now - irrigation_state.start_monotonic > 7200:  # 2 hours
                 issues.append(f"Long-running irrigation in room {room_id}")
         
         # Check for long-running manual runs
         for room_id, manual_state in self._manual_runs.items():
-            start_time = manual_state.get("start_time")
-            if start_time and (now - start_time).total_seconds() > 3600:  # 1 hour
+            start_monotonic = manual_state.get("start_monotonic")
+            if start_monotonic is not None and now - start_monotonic > 3600:  # 1 hour
                 issues.append(f"Long-running manual run in room {room_id}")
         
         # Check daily limits
-        max_daily = self._settings.get("max_daily_irrigation", 3600)
+        max_daily = self._settings.get("max_daily_irrigation", DEFAULT_MAX_DAILY_IRRIGATION)
         for room_id, daily_total in self._daily_irrigation_totals.items():
             if daily_total >= max_daily:
                 issues.append(f"Daily limit reached for room {room_id}")
@@ -1303,15 +1660,18 @@ class IrrigationCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.error("Failed to update logging level: %s", e)
 
-    def should_send_notification(self, notification_type: str = "general") -> bool:
-        """Check if notifications should be sent based on settings."""
-        if not self._settings.get("notifications_enabled", True):
-            return False
+    def _update_notification_gate(self) -> None:
+        """Bind should_send_notification to a gate matching the current settings.
         
-        if notification_type == "error" and not self._settings.get("error_notifications", True):
-            return False
-        
-        return True
+        The notification flags only change with the settings, so the check is
+        chosen here once instead of reading both flags on every notification.
+        """
+        if not self._settings.get("notifications_enabled", DEFAULT_NOTIFICATIONS_ENABLED):
+            self.should_send_notification = _never_notify
+        elif not self._settings.get("error_notifications", DEFAULT_ERROR_NOTIFICATIONS):
+            self.should_send_notification = _notify_except_errors
+        else:
+            self.should_send_notification = _always_notify
 
     async def send_notification(self, message: str, title: str = "Irrigation System", 
                               notification_type: str = "general") -> None:
@@ -1327,7 +1687,7 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 {
                     "title": title,
                     "message": message,
-                    "notification_id": f"irrigation_{notification_type}_{hash(message)}",
+                    "notification_id": f"irrigation_{notification_type}_{_message_digest(message)}",
                 }
             )
             
@@ -1357,14 +1717,13 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             "context": context
         }
         
-        # Add to error history
+        # Add to error history; the deque drops the oldest entry when full
         self._last_errors.append(error_info)
-        if len(self._last_errors) > self._max_error_history:
-            self._last_errors.pop(0)
+        self._error_timestamps.append(time.monotonic())
+        self._error_stats_cache = None
         
         # Update error counts
-        error_key = f"{operation}:{type(error).__name__}"
-        self._error_counts[error_key] = self._error_counts.get(error_key, 0) + 1
+        self._error_counts[(operation, type(error).__name__)] += 1
         
         # Log structured error
         self.irrigation_logger.error(
@@ -1450,31 +1809,34 @@ class IrrigationCoordinator(DataUpdateCoordinator):
         try:
             self.irrigation_logger.warning(f"Emergency hardware reset for room {room_id}")
             
-            # Turn off all zones first
-            for zone_entity in room.zone_entities:
-                try:
-                    await self.hass.services.async_call(
-                        "switch", "turn_off", {"entity_id": zone_entity}
+            # Turn off all zones and the pump at once, one call per entity so
+            # a failing or hung device cannot keep the others on. A slow call
+            # is shielded so giving up on it does not cancel the turn_off itself.
+            entities = [("zone", zone_entity) for zone_entity in room.zone_entities]
+            entities.append(("pump", room.pump_entity))
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(
+                        asyncio.shield(
+                            self.hass.services.async_call("switch", "turn_off", {"entity_id": entity_id})
+                        ),
+                        _EMERGENCY_CALL_TIMEOUT
                     )
-                except Exception as e:
+                    for _, entity_id in entities
+                ),
+                return_exceptions=True
+            )
+            for (kind, entity_id), result in zip(entities, results):
+                if isinstance(result, Exception):
                     self.irrigation_logger.error(
-                        f"Failed to turn off zone {zone_entity} during emergency reset",
-                        error=e, room_id=room_id, entity_id=zone_entity
+                        f"Failed to turn off {kind} {entity_id} during emergency reset",
+                        error=result, room_id=room_id, entity_id=entity_id
                     )
             
-            # Turn off pump
-            try:
-                await self.hass.services.async_call(
-                    "switch", "turn_off", {"entity_id": room.pump_entity}
-                )
-            except Exception as e:
-                self.irrigation_logger.error(
-                    f"Failed to turn off pump {room.pump_entity} during emergency reset",
-                    error=e, room_id=room_id, entity_id=room.pump_entity
-                )
-            
             # Clear any active irrigation state
-            self._active_irrigations.pop(room_id, None)
+            irrigation_state = self._active_irrigations.pop(room_id, None)
+            if irrigation_state is not None:
+                irrigation_state.stop_event.set()
             self._manual_runs.pop(room_id, None)
             
             self.irrigation_logger.info(f"Emergency hardware reset completed for room {room_id}")
@@ -1492,40 +1854,54 @@ class IrrigationCoordinator(DataUpdateCoordinator):
     
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics for monitoring and diagnostics."""
+        # Everything but the time-based rate only changes when an error is recorded
+        if self._error_stats_cache is None:
+            self._error_stats_cache = {
+                "total_errors": len(self._last_errors),
+                "error_counts": {
+                    f"{operation}:{error_type}": count
+                    for (operation, error_type), count in self._error_counts.items()
+                },
+                "recent_errors": list(
+                    islice(self._last_errors, max(len(self._last_errors) - 10, 0), None)
+                ),  # Last 10 errors
+                "most_common_errors": self._get_most_common_errors()
+            }
+        
+        # Hand out copies so callers cannot change the cached statistics
+        cache = self._error_stats_cache
         return {
-            "total_errors": len(self._last_errors),
-            "error_counts": self._error_counts.copy(),
-            "recent_errors": self._last_errors[-10:],  # Last 10 errors
-            "error_rate": self._calculate_error_rate(),
-            "most_common_errors": self._get_most_common_errors()
+            "total_errors": cache["total_errors"],
+            "error_counts": dict(cache["error_counts"]),
+            "recent_errors": [
+                {**error, "context": dict(error["context"])} for error in cache["recent_errors"]
+            ],
+            "most_common_errors": [dict(error) for error in cache["most_common_errors"]],
+            "error_rate": self._calculate_error_rate()
         }
     
     def _calculate_error_rate(self) -> float:
         """Calculate error rate per hour based on recent errors."""
-        if not self._last_errors:
-            return 0.0
-        
-        now = dt_util.now()
-        hour_ago = now - timedelta(hours=1)
+        # Timestamps are in insertion order, so drop expired ones from the left
+        error_timestamps = self._error_timestamps
+        cutoff = time.monotonic() - 3600
+        while error_timestamps and error_timestamps[0] <= cutoff:
+            error_timestamps.popleft()
         
-        recent_errors = [
-            error for error in self._last_errors
-            if datetime.fromisoformat(error["timestamp"]) > hour_ago
-        ]
-        
-        return len(recent_errors)
+        return float(len(error_timestamps))
+
+    def clear_error_history(self) -> None:
+        """Forget all recorded errors."""
+        self._last_errors.clear()
+        self._error_timestamps.clear()
+        self._error_counts.clear()
+        self._error_stats_cache = None
     
     def _get_most_common_errors(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get the most common error types."""
-        sorted_errors = sorted(
-            self._error_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
         return [
-            {"error_type": error_type, "count": count}
-            for error_type, count in sorted_errors[:limit]
+            {"error_type": f"{operation}:{error_type}", "count": count}
+            for (operation, error_type), count in self._error_counts.most_common(limit)
         ]
     
     async def get_comprehensive_diagnostics(self) -> Dict[str, Any]:
@@ -1539,8 +1915,8 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                     "rooms_count": len(self._rooms),
                     "active_irrigations": len(self._active_irrigations),
                     "active_manual_runs": len(self._manual_runs),
-                    "scheduled_events": sum(len(events) for events in self._scheduled_events.values()),
-                    "daily_totals": self._daily_irrigation_totals.copy()
+                    "scheduled_events": self._scheduled_events_total,
+                    "daily_totals": dict(self._daily_irrigation_totals)
                 },
                 "error_statistics": self.get_error_statistics(),
                 "performance_metrics": self.performance_tracker.get_all_metrics(),
@@ -1548,14 +1924,19 @@ class IrrigationCoordinator(DataUpdateCoordinator):
                 "fail_safe_status": self.get_fail_safe_status()
             }
             
-            # Add room-specific diagnostics
-            room_diagnostics = {}
-            for room_id in self._rooms:
-                room_diagnostics[room_id] = await self.diagnostic_collector.collect_room_diagnostics(
-                    room_id, self
-                )
-            
-            diagnostics["room_diagnostics"] = room_diagnostics
+            # Add room-specific diagnostics, collecting all rooms at once
+            room_ids = list(self._rooms)
+            room_results = await asyncio.gather(
+                *(
+                    self.diagnostic_collector.collect_room_diagnostics(room_id, self)
+                    for room_id in room_ids
+                ),
+                return_exceptions=True
+            )
+            diagnostics["room_diagnostics"] = {
+                room_id: {"error": str(result)} if isinstance(result, Exception) else result
+                for room_id, result in zip(room_ids, room_results)
+            }
             
             return diagnostics
             
@@ -1563,11 +1944,16 @@ class IrrigationCoordinator(DataUpdateCoordinator):
             self.irrigation_logger.error("Failed to collect comprehensive diagnostics", error=e)
             return {"error": str(e)}
     
-    async def export_diagnostics_file(self) -> str:
-        """Export diagnostics to a file and return the file path."""
+    async def export_diagnostics_file(self, diagnostics: Optional[Dict[str, Any]] = None) -> str:
+        """Export diagnostics to a file and return the file path.
+        
+        Pass diagnostics that were already collected to write them instead of
+        collecting everything again.
+        """
         try:
-            diagnostics = await self.get_comprehensive_diagnostics()
-            return self.diagnostic_collector.export_diagnostics(diagnostics)
+            if diagnostics is None:
+                diagnostics = await self.get_comprehensive_diagnostics()
+            return await self.diagnostic_collector.async_export_diagnostics(diagnostics)
         except Exception as e:
             self.irrigation_logger.error("Failed to export diagnostics file", error=e)
             return ""
\ No newline at end of file
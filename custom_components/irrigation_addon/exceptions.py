@@ -1,7 +1,9 @@
 """Custom exceptions for the Irrigation Addon integration."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+import re
+from typing import Any, ClassVar, Dict, List, Optional
 
 from homeassistant.exceptions import HomeAssistantError
 
@@ -9,6 +11,9 @@ from homeassistant.exceptions import HomeAssistantError
 class IrrigationError(HomeAssistantError):
     """Base exception for irrigation system errors."""
     
+    # Whether retrying the failed operation may succeed
+    _recoverable: ClassVar[bool] = False
+    
     def __init__(self, message: str, error_code: str = None, details: Dict[str, Any] = None) -> None:
         """Initialize irrigation error."""
         super().__init__(message)
@@ -17,7 +22,15 @@ class IrrigationError(HomeAssistantError):
         self.user_message = message
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging and API responses."""
+        """Convert error to dictionary for logging and API responses.
+        
+        The dictionary is built once per error; each call gets its own copy.
+        """
+        return dict(self._as_dict)
+    
+    @cached_property
+    def _as_dict(self) -> Dict[str, Any]:
+        """Dictionary form of the error, built on first use."""
         return {
             "error_type": self.__class__.__name__,
             "error_code": self.error_code,
@@ -30,6 +43,8 @@ class IrrigationError(HomeAssistantError):
 class EntityUnavailableError(IrrigationError):
     """Raised when required entities are unavailable."""
     
+    _recoverable = True
+    
     def __init__(self, entities: List[str], room_id: str = None) -> None:
         """Initialize entity unavailable error."""
         entity_list = ", ".join(entities)
@@ -129,6 +144,8 @@ class IrrigationConflictError(IrrigationError):
 class HardwareControlError(IrrigationError):
     """Raised when hardware control operations fail."""
     
+    _recoverable = True
+    
     def __init__(self, device_type: str, entity_id: str, operation: str, room_id: str = None, 
                  underlying_error: Exception = None) -> None:
         """Initialize hardware control error."""
@@ -232,6 +249,8 @@ class SchedulingError(IrrigationError):
 class StorageError(IrrigationError):
     """Raised when storage operations fail."""
     
+    _recoverable = True
+    
     def __init__(self, operation: str, data_type: str = None, underlying_error: Exception = None) -> None:
         """Initialize storage error."""
         message = f"Storage error: {operation}"
@@ -289,6 +308,8 @@ class ValidationError(IrrigationError):
 class ServiceError(IrrigationError):
     """Raised when service operations fail."""
     
+    _recoverable = True
+    
     def __init__(self, service_name: str, operation: str, underlying_error: Exception = None) -> None:
         """Initialize service error."""
         message = f"Service error in {service_name}: {operation}"
@@ -342,7 +363,13 @@ class EmergencyStopError(IrrigationError):
         self.scope = scope
         self.failed_operations = failed_operations or []
         self.underlying_error = underlying_error
-        self.user_message = f"Emergency stop failed - manual intervention may be needed"
+        self.user_message = "Emergency stop failed - manual intervention may be needed"
+
+
+# Home Assistant error messages that suggest a transient failure
+_RECOVERABLE_HA_ERROR_RE = re.compile(
+    r"timeout|connection|network|temporary|unavailable", re.IGNORECASE
+)
 
 
 # Error recovery utilities
@@ -352,36 +379,21 @@ class ErrorRecovery:
     @staticmethod
     def is_recoverable_error(error: Exception) -> bool:
         """Check if an error is potentially recoverable."""
-        recoverable_types = [
-            EntityUnavailableError,
-            HardwareControlError,
-            StorageError,
-            ServiceError
-        ]
-        
         # Check if it's a recoverable irrigation error
         if isinstance(error, IrrigationError):
-            return type(error) in recoverable_types
+            return error._recoverable
         
         # Check for common recoverable Home Assistant errors
         if isinstance(error, HomeAssistantError):
-            error_msg = str(error).lower()
-            recoverable_keywords = [
-                "timeout",
-                "connection",
-                "network",
-                "temporary",
-                "unavailable"
-            ]
-            return any(keyword in error_msg for keyword in recoverable_keywords)
+            return _RECOVERABLE_HA_ERROR_RE.search(str(error)) is not None
         
         return False
     
     @staticmethod
     def get_retry_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
         """Calculate exponential backoff delay for retry attempts."""
-        import math
-        delay = base_delay * (2 ** attempt)
+        # Clamp the shift so large attempt counts don't build huge integers
+        delay = base_delay * float(1 << min(max(attempt, 0), 30))
         return min(delay, max_delay)
     
     @staticmethod
@@ -397,6 +409,8 @@ class ErrorRecovery:
 class IrrigationErrorHandler:
     """Context manager for consistent error handling and logging."""
     
+    __slots__ = ("operation", "logger", "room_id", "suppress_exceptions", "error")
+    
     def __init__(self, operation: str, logger, room_id: str = None, 
                  suppress_exceptions: bool = False):
         """Initialize error handler."""
@@ -1,18 +1,28 @@
 """Logging utilities for the Irrigation Addon integration."""
 from __future__ import annotations
 
+from collections import defaultdict, deque
 import logging
 import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .exceptions import IrrigationError
 
+# Measurements kept per performance metric
+_MAX_METRIC_SAMPLES = 100
+
 
 class IrrigationLogger:
     """Enhanced logger for irrigation system with structured logging."""
@@ -21,39 +31,61 @@ class IrrigationLogger:
         """Initialize irrigation logger."""
         self.logger = logging.getLogger(name)
         self.hass = hass
-        self._log_buffer: List[Dict[str, Any]] = []
         self._max_buffer_size = 1000
+        # (sequence number, time.monotonic() when logged, entry), oldest first
+        self._log_buffer: deque[Tuple[int, float, Dict[str, Any]]] = deque(maxlen=self._max_buffer_size)
+        self._log_seq = 0  # sequence number of the next entry
         
-    def _create_log_entry(self, level: str, message: str, **kwargs) -> Dict[str, Any]:
-        """Create structured log entry."""
+        # The same records indexed by level and by category, so filtered
+        # queries only walk matching entries
+        self._logs_by_level: defaultdict[str, deque[Tuple[int, float, Dict[str, Any]]]] = defaultdict(
+            lambda: deque(maxlen=self._max_buffer_size)
+        )
+        self._logs_by_category: defaultdict[str, deque[Tuple[int, float, Dict[str, Any]]]] = defaultdict(
+            lambda: deque(maxlen=self._max_buffer_size)
+        )
+        
+    def _create_log_entry(self, level: str, message: str, *args, **kwargs) -> Dict[str, Any]:
+        """Create structured log entry.
+        
+        With args, message is a %-style format string that is only rendered
+        when the entry is read back through get_recent_logs.
+        """
         entry = {
             "timestamp": dt_util.now().isoformat(),
             "level": level,
             "message": message,
             "component": "irrigation_addon"
         }
+        if args:
+            entry["_message_args"] = args
         
         # Add additional context
         if kwargs:
             entry.update(kwargs)
         
-        # Add to buffer for diagnostics
-        self._log_buffer.append(entry)
-        if len(self._log_buffer) > self._max_buffer_size:
-            self._log_buffer.pop(0)
+        # Add to buffer for diagnostics; the deque drops the oldest entry when full
+        record = (self._log_seq, time.monotonic(), entry)
+        self._log_seq += 1
+        self._log_buffer.append(record)
+        self._logs_by_level[level].append(record)
+        category = kwargs.get("category")
+        if category:
+            self._logs_by_category[category].append(record)
         
         # Record system errors in storage if available
         if self.hass and level in ["ERROR", "CRITICAL"] and kwargs.get("error"):
             try:
                 from .const import DOMAIN
-                coordinators = self.hass.data.get(DOMAIN, {})
+                domain_data = self.hass.data.get(DOMAIN)
+                coordinators = domain_data.coordinators if domain_data else {}
                 for coordinator in coordinators.values():
                     if hasattr(coordinator, 'storage'):
                         # Schedule async error recording
                         self.hass.async_create_task(
                             coordinator.storage.async_record_system_error(
                                 kwargs.get("error_type", "Unknown"),
-                                message
+                                message % args if args else message
                             )
                         )
                         break
@@ -62,8 +94,22 @@ class IrrigationLogger:
         
         return entry
     
+    @staticmethod
+    def _render_message(entry: Dict[str, Any]) -> None:
+        """Format a lazily stored message in place."""
+        args = entry.pop("_message_args", None)
+        if args:
+            entry["message"] = entry["message"] % args
+    
+    def is_debug_enabled(self) -> bool:
+        """Return True if debug messages would be emitted."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+    
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with context."""
+        # Skip building the structured entry when debug output is off
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         entry = self._create_log_entry("DEBUG", message, **kwargs)
         self.logger.debug(message, extra={"structured_data": entry})
     
@@ -104,9 +150,12 @@ class IrrigationLogger:
     def irrigation_event(self, event_type: str, room_id: str, status: str, 
                         duration: int = None, **kwargs) -> None:
         """Log irrigation-specific events."""
+        message = "Irrigation event: %s for room %s - %s"
+        args = (event_type, room_id, status)
         entry = self._create_log_entry(
-            "INFO", 
-            f"Irrigation event: {event_type} for room {room_id} - {status}",
+            "INFO",
+            message,
+            *args,
             event_type=event_type,
             room_id=room_id,
             status=status,
@@ -114,19 +163,23 @@ class IrrigationLogger:
             category="irrigation_event",
             **kwargs
         )
-        self.logger.info(entry["message"], extra={"structured_data": entry})
+        self.logger.info(message, *args, extra={"structured_data": entry})
     
     def hardware_operation(self, device_type: str, entity_id: str, operation: str, 
                           success: bool, room_id: str = None, **kwargs) -> None:
         """Log hardware control operations."""
         status = "SUCCESS" if success else "FAILED"
-        message = f"Hardware {operation}: {device_type} {entity_id} - {status}"
         if room_id:
-            message = f"Room {room_id}: {message}"
+            message = "Room %s: Hardware %s: %s %s - %s"
+            args = (room_id, operation, device_type, entity_id, status)
+        else:
+            message = "Hardware %s: %s %s - %s"
+            args = (operation, device_type, entity_id, status)
         
         entry = self._create_log_entry(
             "INFO" if success else "ERROR",
             message,
+            *args,
             device_type=device_type,
             entity_id=entity_id,
             operation=operation,
@@ -137,59 +190,85 @@ class IrrigationLogger:
         )
         
         if success:
-            self.logger.info(entry["message"], extra={"structured_data": entry})
+            self.logger.info(message, *args, extra={"structured_data": entry})
         else:
-            self.logger.error(entry["message"], extra={"structured_data": entry})
+            self.logger.error(message, *args, extra={"structured_data": entry})
     
     def fail_safe_trigger(self, room_id: str, reason: str, check_type: str, **kwargs) -> None:
         """Log fail-safe mechanism triggers."""
+        message = "Fail-safe triggered for room %s: %s"
+        args = (room_id, reason)
         entry = self._create_log_entry(
             "WARNING",
-            f"Fail-safe triggered for room {room_id}: {reason}",
+            message,
+            *args,
             room_id=room_id,
             reason=reason,
             check_type=check_type,
             category="fail_safe",
             **kwargs
         )
-        self.logger.warning(entry["message"], extra={"structured_data": entry})
+        self.logger.warning(message, *args, extra={"structured_data": entry})
     
     def performance_metric(self, metric_name: str, value: Union[int, float], 
                           unit: str = None, **kwargs) -> None:
         """Log performance metrics."""
+        # Metrics are debug output; skip the entry entirely when it is off
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if unit:
+            message = "Performance metric: %s = %s %s"
+            args = (metric_name, value, unit)
+        else:
+            message = "Performance metric: %s = %s"
+            args = (metric_name, value)
         entry = self._create_log_entry(
             "DEBUG",
-            f"Performance metric: {metric_name} = {value}" + (f" {unit}" if unit else ""),
+            message,
+            *args,
             metric_name=metric_name,
             metric_value=value,
             metric_unit=unit,
             category="performance",
             **kwargs
         )
-        self.logger.debug(entry["message"], extra={"structured_data": entry})
+        self.logger.debug(message, *args, extra={"structured_data": entry})
     
     def get_recent_logs(self, hours: int = 24, level: str = None, 
                        category: str = None) -> List[Dict[str, Any]]:
         """Get recent log entries with optional filtering."""
-        cutoff_time = dt_util.now() - timedelta(hours=hours)
+        cutoff = time.monotonic() - hours * 3600
         
+        # Walk the narrowest index that covers the filters
+        records = self._log_buffer
+        if level:
+            records = self._logs_by_level.get(level, ())
+        if category:
+            category_records = self._logs_by_category.get(category, ())
+            if not level or len(category_records) < len(records):
+                records = category_records
+        
+        # Indexes can hold entries already dropped from the main buffer
+        oldest_seq = self._log_seq - len(self._log_buffer)
+        
+        # Records are in logging order, so walk back from the newest entry
+        # and stop at the first one outside the window
         filtered_logs = []
-        for entry in self._log_buffer:
-            try:
-                entry_time = datetime.fromisoformat(entry["timestamp"])
-                if entry_time < cutoff_time:
-                    continue
-                
-                if level and entry.get("level") != level:
-                    continue
-                
-                if category and entry.get("category") != category:
-                    continue
-                
-                filtered_logs.append(entry)
-            except (ValueError, KeyError):
+        for seq, logged_at, entry in reversed(records):
+            if logged_at < cutoff or seq < oldest_seq:
+                break
+            
+            if level and entry.get("level") != level:
+                continue
+            
+            if category and entry.get("category") != category:
                 continue
+            
+            if "_message_args" in entry:
+                self._render_message(entry)
+            filtered_logs.append(entry)
         
+        filtered_logs.reverse()
         return filtered_logs
     
     def get_error_summary(self, hours: int = 24) -> Dict[str, Any]:
@@ -216,30 +295,25 @@ class PerformanceTracker:
     def __init__(self, logger: IrrigationLogger):
         """Initialize performance tracker."""
         self.logger = logger
-        self._metrics: Dict[str, List[float]] = {}
-        self._operation_times: Dict[str, datetime] = {}
+        self._metrics: Dict[str, deque[float]] = {}  # last _MAX_METRIC_SAMPLES values per metric
+        self._operation_times: Dict[str, float] = {}  # time.monotonic() when each operation started
     
     def start_operation(self, operation_name: str) -> None:
         """Start timing an operation."""
-        self._operation_times[operation_name] = dt_util.now()
+        self._operation_times[operation_name] = time.monotonic()
     
     def end_operation(self, operation_name: str, **kwargs) -> float:
         """End timing an operation and log the duration."""
         if operation_name not in self._operation_times:
             return 0.0
         
-        start_time = self._operation_times.pop(operation_name)
-        duration = (dt_util.now() - start_time).total_seconds()
+        duration = time.monotonic() - self._operation_times.pop(operation_name)
         
-        # Store metric
+        # Store metric; only the last _MAX_METRIC_SAMPLES measurements are kept
         if operation_name not in self._metrics:
-            self._metrics[operation_name] = []
+            self._metrics[operation_name] = deque(maxlen=_MAX_METRIC_SAMPLES)
         self._metrics[operation_name].append(duration)
         
-        # Keep only last 100 measurements
-        if len(self._metrics[operation_name]) > 100:
-            self._metrics[operation_name].pop(0)
-        
         # Log the metric
         self.logger.performance_metric(
             f"{operation_name}_duration",
@@ -254,15 +328,12 @@ class PerformanceTracker:
     def record_metric(self, metric_name: str, value: Union[int, float], 
                      unit: str = None, **kwargs) -> None:
         """Record a custom metric."""
+        # Only the last _MAX_METRIC_SAMPLES measurements are kept
         if metric_name not in self._metrics:
-            self._metrics[metric_name] = []
+            self._metrics[metric_name] = deque(maxlen=_MAX_METRIC_SAMPLES)
         
         self._metrics[metric_name].append(float(value))
         
-        # Keep only last 100 measurements
-        if len(self._metrics[metric_name]) > 100:
-            self._metrics[metric_name].pop(0)
-        
         self.logger.performance_metric(metric_name, value, unit, **kwargs)
     
     def get_metric_stats(self, metric_name: str) -> Dict[str, float]:
@@ -303,19 +374,21 @@ class DiagnosticCollector:
             ha_config_dir = self.hass.config.config_dir
             
             # Get integration info
-            integration_data = self.hass.data.get(DOMAIN, {})
+            domain_data = self.hass.data.get(DOMAIN)
+            integration_data = domain_data.coordinators if domain_data else {}
             
             # Get entity states for irrigation entities
             irrigation_entities = []
-            for state in self.hass.states.async_all():
-                if any(keyword in state.entity_id.lower() for keyword in 
-                      ["pump", "zone", "irrigation", "sprinkler"]):
-                    irrigation_entities.append({
-                        "entity_id": state.entity_id,
-                        "state": state.state,
-                        "attributes": dict(state.attributes),
-                        "last_updated": state.last_updated.isoformat()
-                    })
+            for entity_id in sorted(self._tracked_entity_ids(integration_data)):
+                state = self.hass.states.get(entity_id)
+                if state is None:
+                    continue
+                irrigation_entities.append({
+                    "entity_id": state.entity_id,
+                    "state": state.state,
+                    "attributes": dict(state.attributes),
+                    "last_updated": state.last_updated.isoformat()
+                })
             
             return {
                 "timestamp": dt_util.now().isoformat(),
@@ -337,6 +410,23 @@ class DiagnosticCollector:
             self.logger.error("Failed to collect system info", error=e)
             return {"error": str(e)}
     
+    def _tracked_entity_ids(self, coordinators: Dict[str, Any]) -> set:
+        """Return the entities configured in rooms and those owned by the integration."""
+        entity_reg = er.async_get(self.hass)
+        entity_ids = set()
+        for entry_id, coordinator in coordinators.items():
+            for room in coordinator.rooms.values():
+                entity_ids.add(room.pump_entity)
+                entity_ids.update(room.zone_entities)
+                if room.light_entity:
+                    entity_ids.add(room.light_entity)
+                entity_ids.update(room.sensors.values())
+            entity_ids.update(
+                entry.entity_id
+                for entry in er.async_entries_for_config_entry(entity_reg, entry_id)
+            )
+        return entity_ids
+    
     async def collect_room_diagnostics(self, room_id: str, coordinator) -> Dict[str, Any]:
         """Collect diagnostic information for a specific room."""
         try:
@@ -412,20 +502,31 @@ class DiagnosticCollector:
             return {"error": str(e)}
     
     def export_diagnostics(self, data: Dict[str, Any], filename: str = None) -> str:
-        """Export diagnostic data to JSON file."""
+        """Export diagnostic data to JSON file.
+
+        Blocks on disk I/O; kept for backward compatibility. Use
+        async_export_diagnostics from the event loop.
+        """
+        self.logger.warning(
+            "export_diagnostics writes to disk synchronously, "
+            "use async_export_diagnostics instead"
+        )
         try:
-            if not filename:
-                timestamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"irrigation_diagnostics_{timestamp}.json"
-            
-            # Create diagnostics directory if it doesn't exist
-            diagnostics_dir = Path(self.hass.config.config_dir) / "irrigation_diagnostics"
-            diagnostics_dir.mkdir(exist_ok=True)
-            
-            filepath = diagnostics_dir / filename
+            filepath = self._diagnostics_path(filename)
+            self._write_diagnostics(filepath, data)
             
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            self.logger.info(f"Diagnostics exported to {filepath}")
+            return str(filepath)
+        
+        except Exception as e:
+            self.logger.error("Failed to export diagnostics", error=e)
+            return ""
+    
+    async def async_export_diagnostics(self, data: Dict[str, Any], filename: str = None) -> str:
+        """Export diagnostic data to JSON file without blocking the event loop."""
+        try:
+            filepath = self._diagnostics_path(filename)
+            await self.hass.async_add_executor_job(self._write_diagnostics, filepath, data)
             
             self.logger.info(f"Diagnostics exported to {filepath}")
             return str(filepath)
@@ -433,6 +534,34 @@ class DiagnosticCollector:
         except Exception as e:
             self.logger.error("Failed to export diagnostics", error=e)
             return ""
+    
+    def _diagnostics_path(self, filename: Optional[str]) -> Path:
+        """Return the path a diagnostics export is written to."""
+        if not filename:
+            timestamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"irrigation_diagnostics_{timestamp}.json"
+        
+        return Path(self.hass.config.config_dir) / "irrigation_diagnostics" / filename
+    
+    @staticmethod
+    def _write_diagnostics(filepath: Path, data: Dict[str, Any]) -> None:
+        """Write diagnostics to disk."""
+        # Create diagnostics directory if it doesn't exist
+        filepath.parent.mkdir(exist_ok=True)
+        
+        if orjson is None:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+            return
+        
+        # orjson encodes datetimes natively; default=str only handles the rest
+        filepath.write_bytes(
+            orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        )
 
 
 # Global logger instances
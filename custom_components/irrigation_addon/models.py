@@ -1,11 +1,14 @@
 """Data models for the Irrigation Addon integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import re
+import time
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
@@ -13,8 +16,15 @@ import voluptuous as vol
 
 from .const import EVENT_TYPE_P1, EVENT_TYPE_P2
 
+if TYPE_CHECKING:
+    from .coordinator import IrrigationCoordinator
+    from .services import IrrigationServices
+
 _LOGGER = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class Shot:
@@ -172,7 +182,7 @@ class IrrigationEvent:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Room:
     """Represents a growing room with irrigation configuration."""
     
@@ -237,30 +247,26 @@ class Room:
     async def validate_entities_exist(self, hass: HomeAssistant) -> List[str]:
         """Validate that all configured entities exist in Home Assistant."""
         entity_reg = er.async_get(hass)
+        state_entity_ids: Optional[set] = None
         missing_entities = []
         
-        # Check pump entity
-        if not entity_reg.async_get(self.pump_entity):
-            if self.pump_entity not in hass.states.async_entity_ids():
-                missing_entities.append(f"pump: {self.pump_entity}")
-        
-        # Check zone entities
-        for zone in self.zone_entities:
-            if not entity_reg.async_get(zone):
-                if zone not in hass.states.async_entity_ids():
-                    missing_entities.append(f"zone: {zone}")
-        
-        # Check light entity
+        # Check every configured entity against the registry, falling back to
+        # one snapshot of the state machine for entities it does not know
+        entities = [("pump", self.pump_entity)]
+        entities.extend(("zone", zone) for zone in self.zone_entities)
         if self.light_entity:
-            if not entity_reg.async_get(self.light_entity):
-                if self.light_entity not in hass.states.async_entity_ids():
-                    missing_entities.append(f"light: {self.light_entity}")
+            entities.append(("light", self.light_entity))
+        entities.extend(
+            (f"sensor ({sensor_type})", entity_id) for sensor_type, entity_id in self.sensors.items()
+        )
         
-        # Check sensor entities
-        for sensor_type, entity_id in self.sensors.items():
-            if not entity_reg.async_get(entity_id):
-                if entity_id not in hass.states.async_entity_ids():
-                    missing_entities.append(f"sensor ({sensor_type}): {entity_id}")
+        for label, entity_id in entities:
+            if entity_reg.async_get(entity_id):
+                continue
+            if state_entity_ids is None:
+                state_entity_ids = set(hass.states.async_entity_ids())
+            if entity_id not in state_entity_ids:
+                missing_entities.append(f"{label}: {entity_id}")
         
         return missing_entities
     
@@ -313,6 +319,31 @@ class Room:
         )
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class ActiveIrrigation:
+    """Progress of an irrigation event that is currently running."""
+    
+    event_type: str
+    shots: List[Shot]
+    total_shots: int
+    start_time: datetime
+    total_duration: int
+    start_monotonic: float = field(default_factory=time.monotonic)  # time.monotonic() when the run started
+    current_shot: int = 0
+    shot_start_monotonic: Optional[float] = None  # time.monotonic() when the current shot started
+    shot_duration: int = 0
+    progress: float = 0.0
+    stop_event: asyncio.Event = field(default_factory=asyncio.Event)  # set to interrupt the running shot
+
+
+@dataclass
+class IrrigationDomainData:
+    """Integration-wide data stored in hass.data[DOMAIN]."""
+    
+    coordinators: Dict[str, IrrigationCoordinator] = field(default_factory=dict)  # entry_id -> coordinator
+    services: Optional[IrrigationServices] = None
+
+
 # Validation schemas for external use
 SHOT_SCHEMA = vol.Schema({
     vol.Required("duration"): vol.All(int, vol.Range(min=1, max=3600)),
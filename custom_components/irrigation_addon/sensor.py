@@ -36,7 +36,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor entities."""
-    coordinator: IrrigationCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: IrrigationCoordinator = hass.data[DOMAIN].coordinators[entry.entry_id]
     
     entities = []
     
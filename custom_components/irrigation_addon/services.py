@@ -275,17 +275,18 @@ class IrrigationServices:
 
     def _get_coordinator(self, entry_id: str = None) -> IrrigationCoordinator:
         """Get the coordinator instance."""
-        if not self.hass.data.get(DOMAIN):
+        domain_data = self.hass.data.get(DOMAIN)
+        if domain_data is None:
             raise HomeAssistantError("Irrigation addon not loaded")
 
         # If no entry_id specified, get the first available coordinator
         if entry_id is None:
-            coordinators = list(self.hass.data[DOMAIN].values())
+            coordinators = list(domain_data.coordinators.values())
             if not coordinators:
                 raise HomeAssistantError("No irrigation coordinators available")
             return coordinators[0]
 
-        coordinator = self.hass.data[DOMAIN].get(entry_id)
+        coordinator = domain_data.coordinators.get(entry_id)
         if not coordinator:
             raise HomeAssistantError(f"Coordinator not found for entry {entry_id}")
 
@@ -555,9 +556,9 @@ class IrrigationServices:
             
             # Get current data from coordinator
             data = {
-                "rooms": coordinator.rooms,
+                "rooms": dict(coordinator.rooms),
                 "sensor_data": coordinator.data.get("sensor_data", {}) if coordinator.data else {},
-                "settings": coordinator.settings,
+                "settings": dict(coordinator.settings),
                 "room_statuses": coordinator.get_all_room_statuses(),
             }
 
@@ -594,7 +595,8 @@ class IrrigationServices:
             await coordinator.storage.async_restore_backup(backup_data)
 
             # Reload coordinator data
-            await coordinator.async_setup()
+            await coordinator.async_reload_storage()
+            await coordinator.async_request_refresh()
 
             _LOGGER.info("Backup restored successfully")
 
@@ -628,7 +630,7 @@ class IrrigationServices:
                     diagnostics["error_statistics"].pop("recent_errors", None)
 
             # Export to file
-            filepath = await coordinator.export_diagnostics_file()
+            filepath = await coordinator.export_diagnostics_file(diagnostics)
 
             _LOGGER.info("Diagnostics exported successfully")
             return {
@@ -663,9 +665,8 @@ class IrrigationServices:
         try:
             coordinator = self._get_coordinator()
             
-            # Clear error history (this would need to be implemented in coordinator)
-            coordinator._last_errors.clear()
-            coordinator._error_counts.clear()
+            # Clear error history
+            coordinator.clear_error_history()
 
             _LOGGER.info("Error history cleared successfully")
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 import json
 from datetime import datetime
 
@@ -38,6 +38,8 @@ class IrrigationStorage:
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data: Dict[str, Any] = {}
         self._loaded = False
+        self._room_names_lower: Optional[FrozenSet[str]] = None
+        self._room_options: Optional[List[str]] = None
 
     async def async_load(self) -> None:
         """Load data from storage."""
@@ -54,12 +56,14 @@ class IrrigationStorage:
                 await self._async_migrate_data()
             
             self._loaded = True
+            self._invalidate_room_cache()
             _LOGGER.debug("Storage data loaded successfully")
             
         except Exception as e:
             _LOGGER.error("Failed to load storage data: %s", e)
             self._data = self._get_default_data()
             self._loaded = True
+            self._invalidate_room_cache()
             raise HomeAssistantError(f"Failed to load irrigation storage: {e}")
 
     async def async_save(self) -> None:
@@ -142,6 +146,29 @@ class IrrigationStorage:
         
         return rooms
 
+    def get_room_names_lower(self) -> FrozenSet[str]:
+        """Get the lowercased names of all rooms for duplicate checks."""
+        if self._room_names_lower is None:
+            self._room_names_lower = frozenset(
+                room_data.get("name", "").lower()
+                for room_data in self._data.get("rooms", {}).values()
+            )
+        return self._room_names_lower
+
+    def get_room_options(self) -> List[str]:
+        """Get "room_id: name" labels for room selectors."""
+        if self._room_options is None:
+            self._room_options = [
+                f"{room_id}: {room_data.get('name', '')}"
+                for room_id, room_data in self._data.get("rooms", {}).items()
+            ]
+        return self._room_options
+
+    def _invalidate_room_cache(self) -> None:
+        """Drop cached room lookups after rooms change."""
+        self._room_names_lower = None
+        self._room_options = None
+
     async def async_get_rooms(self) -> Dict[str, Room]:
         """Get all rooms."""
         if not self._loaded:
@@ -162,12 +189,30 @@ class IrrigationStorage:
         try:
             room.validate()
             self._data.setdefault("rooms", {})[room.room_id] = room.to_dict()
+            self._invalidate_room_cache()
             await self.async_save()
             _LOGGER.debug("Room %s saved successfully", room.room_id)
         except Exception as e:
             _LOGGER.error("Failed to save room %s: %s", room.room_id, e)
             raise HomeAssistantError(f"Failed to save room {room.room_id}: {e}")
 
+    async def async_save_rooms(self, rooms: List[Room]) -> None:
+        """Save several rooms to storage with a single write."""
+        if not self._loaded:
+            await self.async_load()
+        
+        try:
+            stored_rooms = self._data.setdefault("rooms", {})
+            for room in rooms:
+                room.validate()
+                stored_rooms[room.room_id] = room.to_dict()
+            self._invalidate_room_cache()
+            await self.async_save()
+            _LOGGER.debug("Saved %d rooms", len(rooms))
+        except Exception as e:
+            _LOGGER.error("Failed to save rooms: %s", e)
+            raise HomeAssistantError(f"Failed to save rooms: {e}")
+
     async def add_room(self, room_data: Dict[str, Any]) -> str:
         """Add a new room and return its ID."""
         if not self._loaded:
@@ -215,6 +260,7 @@ class IrrigationStorage:
         
         if room_id in self._data.get("rooms", {}):
             del self._data["rooms"][room_id]
+            self._invalidate_room_cache()
             await self.async_save()
             _LOGGER.info("Room %s deleted successfully", room_id)
             return True
@@ -515,6 +561,7 @@ class IrrigationStorage:
             # Restore data
             self._data = backup_data["data"]
             self._loaded = True
+            self._invalidate_room_cache()
             
             await self.async_save()
             _LOGGER.info("Backup restored successfully")
@@ -544,5 +591,6 @@ class IrrigationStorage:
     async def async_reset_data(self) -> None:
         """Reset all data to defaults."""
         self._data = self._get_default_data()
+        self._invalidate_room_cache()
         await self.async_save()
         _LOGGER.warning("All irrigation data has been reset to defaults")
\ No newline at end of file
@@ -25,7 +25,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switch entities."""
-    coordinator: IrrigationCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: IrrigationCoordinator = hass.data[DOMAIN].coordinators[entry.entry_id]
     
     entities = []
     
@@ -140,9 +140,6 @@ class ManualIrrigationSwitch(IrrigationSwitchBase):
             if not success:
                 raise HomeAssistantError(f"Failed to start manual irrigation for room {self.room_id}")
             
-            # Request coordinator update
-            await self.coordinator.async_request_refresh()
-            
         except Exception as e:
             _LOGGER.error("Error turning on manual irrigation for room %s: %s", self.room_id, e)
             raise HomeAssistantError(f"Failed to start manual irrigation: {e}")
@@ -155,9 +152,6 @@ class ManualIrrigationSwitch(IrrigationSwitchBase):
             if not success:
                 _LOGGER.warning("No manual irrigation was running for room %s", self.room_id)
             
-            # Request coordinator update
-            await self.coordinator.async_request_refresh()
-            
         except Exception as e:
             _LOGGER.error("Error turning off manual irrigation for room %s: %s", self.room_id, e)
             raise HomeAssistantError(f"Failed to stop manual irrigation: {e}")
@@ -5,13 +5,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
 from custom_components.irrigation_addon.const import DOMAIN
+from custom_components.irrigation_addon.models import IrrigationDomainData
 
 
 @pytest.fixture
 def hass():
     """Return a mock Home Assistant instance."""
     hass_mock = MagicMock(spec=HomeAssistant)
-    hass_mock.data = {DOMAIN: {}}
+    hass_mock.data = {DOMAIN: IrrigationDomainData()}
     hass_mock.states = MagicMock()
     hass_mock.services = MagicMock()
     hass_mock.async_create_task = MagicMock()
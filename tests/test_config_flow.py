@@ -7,13 +7,14 @@ from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.irrigation_addon.config_flow import IrrigationAddonConfigFlow
 from custom_components.irrigation_addon.const import DOMAIN
+from custom_components.irrigation_addon.models import IrrigationDomainData
 
 
 @pytest.fixture
 def mock_hass():
     """Create a mock Home Assistant instance."""
     hass = MagicMock(spec=HomeAssistant)
-    hass.data = {DOMAIN: {}}
+    hass.data = {DOMAIN: IrrigationDomainData()}
     return hass
 
 
@@ -30,81 +31,32 @@ class TestIrrigationAddonConfigFlow:
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "user"
         assert "name" in result["data_schema"].schema
-
-    async def test_form_user_step_with_input(self):
-        """Test the user step with valid input."""
-        flow = IrrigationAddonConfigFlow()
-        flow.hass = MagicMock()
-        flow.async_set_unique_id = MagicMock()
-        flow._abort_if_unique_id_configured = MagicMock()
-        
-        user_input = {"name": "Test Irrigation System"}
-        result = await flow.async_step_user(user_input)
-        
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "settings"
-        assert flow._name == "Test Irrigation System"
-
-    async def test_form_settings_step(self):
-        """Test the settings step form."""
-        flow = IrrigationAddonConfigFlow()
-        flow.hass = MagicMock()
-        flow._name = "Test System"
-        
-        result = await flow.async_step_settings()
-        
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "settings"
         assert "pump_zone_delay" in result["data_schema"].schema
         assert "sensor_update_interval" in result["data_schema"].schema
         assert "fail_safe_enabled" in result["data_schema"].schema
 
-    async def test_form_settings_step_with_input(self):
-        """Test the settings step with valid input."""
+    async def test_form_user_step_create_entry(self):
+        """Test creating entry directly from the user step."""
         flow = IrrigationAddonConfigFlow()
         flow.hass = MagicMock()
-        flow._name = "Test System"
+        flow.async_set_unique_id = AsyncMock()
+        flow._abort_if_unique_id_configured = MagicMock()
         
-        settings_input = {
+        user_input = {
+            "name": "Test System",
             "pump_zone_delay": 5,
             "sensor_update_interval": 60,
             "default_manual_duration": 600,
             "fail_safe_enabled": True
         }
-        
-        result = await flow.async_step_settings(settings_input)
-        
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "confirm"
-        assert flow._settings == settings_input
-
-    async def test_form_confirm_step(self):
-        """Test the confirmation step."""
-        flow = IrrigationAddonConfigFlow()
-        flow.hass = MagicMock()
-        flow._name = "Test System"
-        flow._settings = {"pump_zone_delay": 3}
-        
-        result = await flow.async_step_confirm()
-        
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "confirm"
-        assert "Test System" in result["description_placeholders"]["name"]
-
-    async def test_form_confirm_step_create_entry(self):
-        """Test creating entry from confirmation step."""
-        flow = IrrigationAddonConfigFlow()
-        flow.hass = MagicMock()
-        flow._name = "Test System"
-        flow._settings = {"pump_zone_delay": 3, "fail_safe_enabled": True}
-        
-        result = await flow.async_step_confirm({"confirm": True})
+        result = await flow.async_step_user(user_input)
         
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert result["title"] == "Test System"
         assert result["data"]["name"] == "Test System"
-        assert result["data"]["settings"]["pump_zone_delay"] == 3
+        assert result["data"]["settings"]["pump_zone_delay"] == 5
         assert result["data"]["settings"]["fail_safe_enabled"] is True
+        assert "name" not in result["data"]["settings"]
 
     async def test_options_flow_init(self, mock_hass):
         """Test options flow initialization."""
@@ -142,10 +94,13 @@ class TestIrrigationAddonConfigFlow:
         assert result["data"]["settings"]["sensor_update_interval"] == 45
         assert result["data"]["settings"]["fail_safe_enabled"] is False
 
-    @patch('custom_components.irrigation_addon.config_flow._validate_entity_exists')
-    async def test_add_room_valid_entities(self, mock_validate, mock_hass):
+    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
+    @patch('custom_components.irrigation_addon.config_flow._get_known_entity_ids')
+    async def test_add_room_valid_entities(self, mock_known, mock_get_registry, mock_hass):
         """Test adding a room with valid entities."""
-        mock_validate.return_value = True
+        mock_known.return_value = {
+            "switch.pump1", "switch.zone1", "light.grow_light", "sensor.moisture"
+        }
         
         config_entry = MagicMock()
         config_entry.data = {"settings": {}}
@@ -154,10 +109,13 @@ class TestIrrigationAddonConfigFlow:
         mock_coordinator = MagicMock()
         mock_coordinator.storage = MagicMock()
         mock_coordinator.storage.get_rooms.return_value = {}
+        mock_coordinator.storage.get_room_names_lower.return_value = frozenset()
         mock_coordinator.storage.add_room = AsyncMock()
         mock_coordinator.async_request_refresh = AsyncMock()
         
-        mock_hass.data = {DOMAIN: {config_entry.entry_id: mock_coordinator}}
+        mock_hass.data = {
+            DOMAIN: IrrigationDomainData(coordinators={config_entry.entry_id: mock_coordinator})
+        }
         
         from custom_components.irrigation_addon.config_flow import IrrigationAddonOptionsFlow
         options_flow = IrrigationAddonOptionsFlow(config_entry)
@@ -179,20 +137,21 @@ class TestIrrigationAddonConfigFlow:
             assert result["type"] == FlowResultType.CREATE_ENTRY
             mock_coordinator.storage.add_room.assert_called_once()
 
-    @patch('custom_components.irrigation_addon.config_flow._validate_entity_exists')
-    async def test_add_room_invalid_pump_entity(self, mock_validate, mock_hass):
+    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
+    @patch('custom_components.irrigation_addon.config_flow._get_known_entity_ids')
+    async def test_add_room_invalid_pump_entity(self, mock_known, mock_get_registry, mock_hass):
         """Test adding a room with invalid pump entity."""
-        def validate_side_effect(hass, entity_id):
-            return entity_id != "switch.invalid_pump"
-        
-        mock_validate.side_effect = validate_side_effect
+        mock_known.return_value = {"switch.pump1", "switch.zone1"}
         
         config_entry = MagicMock()
         mock_coordinator = MagicMock()
         mock_coordinator.storage = MagicMock()
         mock_coordinator.storage.get_rooms.return_value = {}
+        mock_coordinator.storage.get_room_names_lower.return_value = frozenset()
         
-        mock_hass.data = {DOMAIN: {config_entry.entry_id: mock_coordinator}}
+        mock_hass.data = {
+            DOMAIN: IrrigationDomainData(coordinators={config_entry.entry_id: mock_coordinator})
+        }
         
         from custom_components.irrigation_addon.config_flow import IrrigationAddonOptionsFlow
         options_flow = IrrigationAddonOptionsFlow(config_entry)
@@ -212,7 +171,8 @@ class TestIrrigationAddonConfigFlow:
             assert result["type"] == FlowResultType.FORM
             assert "invalid_pump_entity" in result["errors"]["pump_entity"]
 
-    async def test_add_room_duplicate_name(self, mock_hass):
+    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
+    async def test_add_room_duplicate_name(self, mock_get_registry, mock_hass):
         """Test adding a room with duplicate name."""
         config_entry = MagicMock()
         
@@ -223,8 +183,11 @@ class TestIrrigationAddonConfigFlow:
         mock_coordinator = MagicMock()
         mock_coordinator.storage = MagicMock()
         mock_coordinator.storage.get_rooms.return_value = {"room1": existing_room}
+        mock_coordinator.storage.get_room_names_lower.return_value = frozenset({"test room"})
         
-        mock_hass.data = {DOMAIN: {config_entry.entry_id: mock_coordinator}}
+        mock_hass.data = {
+            DOMAIN: IrrigationDomainData(coordinators={config_entry.entry_id: mock_coordinator})
+        }
         
         from custom_components.irrigation_addon.config_flow import IrrigationAddonOptionsFlow
         options_flow = IrrigationAddonOptionsFlow(config_entry)
@@ -257,7 +220,9 @@ class TestIrrigationAddonConfigFlow:
         mock_coordinator.storage.delete_room = AsyncMock()
         mock_coordinator.async_request_refresh = AsyncMock()
         
-        mock_hass.data = {DOMAIN: {config_entry.entry_id: mock_coordinator}}
+        mock_hass.data = {
+            DOMAIN: IrrigationDomainData(coordinators={config_entry.entry_id: mock_coordinator})
+        }
         
         from custom_components.irrigation_addon.config_flow import IrrigationAddonOptionsFlow
         options_flow = IrrigationAddonOptionsFlow(config_entry)
@@ -273,6 +238,7 @@ class TestIrrigationAddonConfigFlow:
         result = await options_flow.async_step_delete_room({"confirm_delete": True})
         assert result["type"] == FlowResultType.CREATE_ENTRY
         mock_coordinator.storage.delete_room.assert_called_once_with("room1")
+        mock_hass.async_create_task.assert_called_once()
 
     async def test_delete_room_cancel(self, mock_hass):
         """Test room deletion cancellation."""
@@ -285,7 +251,9 @@ class TestIrrigationAddonConfigFlow:
         mock_coordinator.storage = MagicMock()
         mock_coordinator.storage.get_rooms.return_value = {"room1": existing_room}
         
-        mock_hass.data = {DOMAIN: {config_entry.entry_id: mock_coordinator}}
+        mock_hass.data = {
+            DOMAIN: IrrigationDomainData(coordinators={config_entry.entry_id: mock_coordinator})
+        }
         
         from custom_components.irrigation_addon.config_flow import IrrigationAddonOptionsFlow
         options_flow = IrrigationAddonOptionsFlow(config_entry)
@@ -303,79 +271,68 @@ class TestIrrigationAddonConfigFlow:
         # Should return to rooms step
         options_flow.async_step_rooms.assert_called_once()
 
-
-class TestConfigFlowHelpers:
-    """Test config flow helper functions."""
-
-    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
-    async def test_validate_entity_exists_in_registry(self, mock_get_registry):
-        """Test entity validation when entity exists in registry."""
-        mock_registry = MagicMock()
-        mock_registry.async_get.return_value = MagicMock()  # Entity exists
-        mock_get_registry.return_value = mock_registry
-        
-        mock_hass = MagicMock()
+    async def test_domain_entities_cached_between_renders(self, mock_hass):
+        """Test entity listings are reused across form renders."""
+        config_entry = MagicMock()
         
-        from custom_components.irrigation_addon.config_flow import _validate_entity_exists
-        result = await _validate_entity_exists(mock_hass, "switch.test")
+        from custom_components.irrigation_addon.config_flow import IrrigationAddonOptionsFlow
+        options_flow = IrrigationAddonOptionsFlow(config_entry)
+        options_flow.hass = mock_hass
         
-        assert result is True
-        mock_registry.async_get.assert_called_once_with("switch.test")
-
-    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
-    async def test_validate_entity_exists_in_states(self, mock_get_registry):
-        """Test entity validation when entity exists in states."""
         mock_registry = MagicMock()
-        mock_registry.async_get.return_value = None  # Not in registry
-        mock_get_registry.return_value = mock_registry
         
-        mock_hass = MagicMock()
-        mock_hass.states.get.return_value = MagicMock()  # Exists in states
-        
-        from custom_components.irrigation_addon.config_flow import _validate_entity_exists
-        result = await _validate_entity_exists(mock_hass, "switch.test")
-        
-        assert result is True
-        mock_hass.states.get.assert_called_once_with("switch.test")
+        with patch('custom_components.irrigation_addon.config_flow._get_entities_by_domain') as mock_get_entities:
+            mock_get_entities.return_value = ["switch.pump1"]
+            
+            first = options_flow._get_domain_entities(mock_registry, "switch")
+            second = options_flow._get_domain_entities(mock_registry, "switch")
+            
+            assert first == second == ["switch.pump1"]
+            mock_get_entities.assert_called_once_with(mock_registry, mock_hass, "switch")
 
-    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
-    async def test_validate_entity_not_exists(self, mock_get_registry):
-        """Test entity validation when entity doesn't exist."""
+
+class TestConfigFlowHelpers:
+    """Test config flow helper functions."""
+
+    async def test_get_known_entity_ids(self):
+        """Test known entity ids combine registry and state machine."""
         mock_registry = MagicMock()
-        mock_registry.async_get.return_value = None  # Not in registry
-        mock_get_registry.return_value = mock_registry
+        mock_registry.entities = {"switch.registered": MagicMock()}
         
         mock_hass = MagicMock()
-        mock_hass.states.get.return_value = None  # Not in states
+        mock_hass.states.async_entity_ids.return_value = ["switch.stateful"]
         
-        from custom_components.irrigation_addon.config_flow import _validate_entity_exists
-        result = await _validate_entity_exists(mock_hass, "switch.test")
+        from custom_components.irrigation_addon.config_flow import _get_known_entity_ids
+        result = _get_known_entity_ids(mock_hass, mock_registry)
         
-        assert result is False
+        assert result == {"switch.registered", "switch.stateful"}
 
-    @patch('custom_components.irrigation_addon.config_flow.async_get_entity_registry')
-    async def test_get_entities_by_domain(self, mock_get_registry):
+    async def test_get_entities_by_domain(self):
         """Test getting entities by domain."""
         # Mock registry entities
         mock_entity1 = MagicMock()
         mock_entity1.entity_id = "switch.pump1"
+        mock_entity1.domain = "switch"
         mock_entity2 = MagicMock()
         mock_entity2.entity_id = "switch.zone1"
+        mock_entity2.domain = "switch"
         mock_entity3 = MagicMock()
         mock_entity3.entity_id = "light.grow_light"
+        mock_entity3.domain = "light"
         
         mock_registry = MagicMock()
         mock_registry.entities.values.return_value = [mock_entity1, mock_entity2, mock_entity3]
-        mock_get_registry.return_value = mock_registry
+        mock_registry.entities.get_entries_for_domain.return_value = [mock_entity1, mock_entity2]
         
         mock_hass = MagicMock()
-        mock_hass.states.async_entity_ids.return_value = ["switch.extra_switch"]
+        mock_hass.states.async_entity_ids.return_value = ["switch.extra_switch", "switch.pump1"]
         
         from custom_components.irrigation_addon.config_flow import _get_entities_by_domain
-        result = await _get_entities_by_domain(mock_hass, "switch")
+        result = _get_entities_by_domain(mock_registry, mock_hass, "switch")
         
         assert "switch.pump1" in result
         assert "switch.zone1" in result
         assert "switch.extra_switch" in result
         assert "light.grow_light" not in result
+        assert result.count("switch.pump1") == 1
         assert len([e for e in result if e.startswith("switch.")]) == 3
\ No newline at end of file
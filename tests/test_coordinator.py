@@ -1,13 +1,17 @@
 """Test irrigation coordinator functionality."""
+import asyncio
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 
 from custom_components.irrigation_addon.coordinator import IrrigationCoordinator
-from custom_components.irrigation_addon.models import Room, IrrigationEvent, Shot
+from custom_components.irrigation_addon.models import ActiveIrrigation, Room, IrrigationEvent, Shot
 from custom_components.irrigation_addon.const import EVENT_TYPE_P1, EVENT_TYPE_P2
 
 
@@ -17,6 +21,7 @@ def mock_hass():
     hass = MagicMock(spec=HomeAssistant)
     hass.states = MagicMock()
     hass.services = MagicMock()
+    hass.bus = MagicMock()
     hass.async_create_task = MagicMock()
     return hass
 
@@ -72,7 +77,7 @@ class TestIrrigationCoordinator:
     async def test_coordinator_initialization(self, coordinator, mock_hass, mock_config_entry):
         """Test coordinator initialization."""
         assert coordinator.hass == mock_hass
-        assert coordinator.entry == mock_config_entry
+        assert coordinator.config_entry == mock_config_entry
         assert coordinator._rooms == {}
         assert coordinator._settings == {}
 
@@ -81,49 +86,75 @@ class TestIrrigationCoordinator:
         coordinator.storage.async_get_rooms.return_value = {}
         coordinator.storage.async_get_settings.return_value = {"sensor_update_interval": 30}
         
-        await coordinator.async_setup()
+        await coordinator._async_setup()
         
         coordinator.storage.async_load.assert_called_once()
         coordinator.storage.async_get_rooms.assert_called_once()
         coordinator.storage.async_get_settings.assert_called_once()
 
-    async def test_async_add_room(self, coordinator, sample_room):
+    async def test_first_refresh_loads_storage_without_setup_hook(self, coordinator, monkeypatch):
+        """Test storage is loaded on Home Assistant versions without the setup hook."""
+        monkeypatch.setattr(
+            "custom_components.irrigation_addon.coordinator._COORDINATOR_HAS_SETUP_HOOK", False
+        )
+        coordinator.async_reload_storage = AsyncMock()
+
+        with patch(
+            "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_config_entry_first_refresh",
+            new_callable=AsyncMock,
+        ) as mock_first_refresh:
+            await coordinator.async_config_entry_first_refresh()
+
+        coordinator.async_reload_storage.assert_awaited_once()
+        mock_first_refresh.assert_awaited_once()
+
+    async def test_rooms_and_settings_are_read_only_views(self, coordinator, sample_room):
+        """Test the rooms and settings properties expose live read-only views."""
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator._settings["fail_safe_enabled"] = True
+        
+        assert coordinator.rooms[sample_room.room_id] is sample_room
+        assert coordinator.settings["fail_safe_enabled"] is True
+        with pytest.raises(TypeError):
+            coordinator.rooms["other"] = sample_room
+
+    async def test_async_add_room(self, coordinator, sample_room, monkeypatch):
         """Test adding a room."""
         # Mock entity validation
-        sample_room.validate_entities_exist = AsyncMock(return_value=[])
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=[]))
         coordinator.storage.async_save_room = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
         
         await coordinator.async_add_room(sample_room)
         
         coordinator.storage.async_save_room.assert_called_once_with(sample_room)
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_set_updated_data.assert_called_once()
         assert coordinator._rooms[sample_room.room_id] == sample_room
 
-    async def test_async_add_room_missing_entities(self, coordinator, sample_room):
+    async def test_async_add_room_missing_entities(self, coordinator, sample_room, monkeypatch):
         """Test adding a room with missing entities."""
         # Mock entity validation to return missing entities
-        sample_room.validate_entities_exist = AsyncMock(return_value=["switch.missing"])
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=["switch.missing"]))
         
         with pytest.raises(HomeAssistantError, match="Missing entities"):
             await coordinator.async_add_room(sample_room)
 
-    async def test_async_update_room(self, coordinator, sample_room):
+    async def test_async_update_room(self, coordinator, sample_room, monkeypatch):
         """Test updating a room."""
         # Setup existing room
         coordinator._rooms[sample_room.room_id] = sample_room
         
         # Mock entity validation
-        sample_room.validate_entities_exist = AsyncMock(return_value=[])
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=[]))
         coordinator.storage.async_save_room = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
         
         # Update room name
         sample_room.name = "Updated Room"
         await coordinator.async_update_room(sample_room)
         
         coordinator.storage.async_save_room.assert_called_once_with(sample_room)
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_set_updated_data.assert_called_once()
         assert coordinator._rooms[sample_room.room_id].name == "Updated Room"
 
     async def test_async_delete_room(self, coordinator, sample_room):
@@ -131,27 +162,77 @@ class TestIrrigationCoordinator:
         # Setup existing room
         coordinator._rooms[sample_room.room_id] = sample_room
         coordinator.storage.async_delete_room = AsyncMock(return_value=True)
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
         
         await coordinator.async_delete_room(sample_room.room_id)
         
         coordinator.storage.async_delete_room.assert_called_once_with(sample_room.room_id)
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_set_updated_data.assert_called_once()
         assert sample_room.room_id not in coordinator._rooms
 
+    async def test_async_update_room_publishes_room_sensors(self, coordinator, sample_room, monkeypatch):
+        """Test updating a room only re-reads that room's sensors."""
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator.data = {
+            "rooms": coordinator._rooms,
+            "sensor_data": {"room2": {"soil_rh": {"value": 40.0}}},
+            "settings": {},
+        }
+        coordinator.hass.states.get.return_value = MagicMock(
+            state="45.0", attributes={"unit_of_measurement": "%"}, last_updated=datetime(2024, 1, 1)
+        )
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=[]))
+        coordinator.storage.async_save_room = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
+        
+        await coordinator.async_update_room(sample_room)
+        
+        data = coordinator.async_set_updated_data.call_args[0][0]
+        assert data["sensor_data"]["room2"] == {"soil_rh": {"value": 40.0}}
+        assert data["sensor_data"][sample_room.room_id]["soil_rh"]["value"] == 45.0
+
     async def test_async_update_settings(self, coordinator):
         """Test updating settings."""
         new_settings = {"sensor_update_interval": 60, "fail_safe_enabled": False}
         coordinator.storage.async_update_settings = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
         
         await coordinator.async_update_settings(new_settings)
         
         coordinator.storage.async_update_settings.assert_called_once_with(new_settings)
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_set_updated_data.assert_called_once()
         assert coordinator._settings["sensor_update_interval"] == 60
         assert coordinator._settings["fail_safe_enabled"] is False
 
+    async def test_update_data_reuses_unchanged_room_sensors(self, coordinator, sample_room):
+        """Test sensor readings are only rebuilt when a room's states change."""
+        coordinator._rooms[sample_room.room_id] = sample_room
+        
+        states = {
+            "sensor.moisture": MagicMock(state="45.0", attributes={"unit_of_measurement": "%"}, last_updated=datetime(2024, 1, 1)),
+            "sensor.temp": MagicMock(state="unavailable"),
+        }
+        coordinator.hass.states.get.side_effect = states.get
+        
+        first = await coordinator._async_update_data()
+        second = await coordinator._async_update_data()
+        
+        assert first["sensor_data"]["room1"]["soil_rh"]["value"] == 45.0
+        assert first["sensor_data"]["room1"]["temperature"]["unavailable"] is True
+        assert second["sensor_data"]["room1"] is first["sensor_data"]["room1"]
+        
+        states["sensor.moisture"] = MagicMock(state="50.0", attributes={"unit_of_measurement": "%"}, last_updated=datetime(2024, 1, 2))
+        third = await coordinator._async_update_data()
+        
+        assert third["sensor_data"]["room1"]["soil_rh"]["value"] == 50.0
+
+    async def test_update_data_without_rooms(self, coordinator):
+        """Test polling with no rooms skips sensor reads."""
+        data = await coordinator._async_update_data()
+        
+        assert data["sensor_data"] == {}
+        coordinator.hass.states.get.assert_not_called()
+
     async def test_get_room_status(self, coordinator, sample_room):
         """Test getting room status."""
         coordinator._rooms[sample_room.room_id] = sample_room
@@ -165,15 +246,32 @@ class TestIrrigationCoordinator:
         assert "next_events" in status
         assert "last_events" in status
 
+    async def test_get_room_status_lists_enabled_events(self, coordinator, sample_room, sample_event, monkeypatch):
+        """Test room status only reports enabled events after an update."""
+        disabled_event = IrrigationEvent(event_type=EVENT_TYPE_P2, shots=[Shot(duration=30)], enabled=False)
+        sample_room.events = [sample_event, disabled_event]
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=[]))
+        coordinator.storage.async_save_room = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
+        
+        await coordinator.async_update_room(sample_room)
+        status = coordinator.get_room_status(sample_room.room_id)
+        
+        assert list(status["next_events"]) == [EVENT_TYPE_P1]
+        assert list(status["last_events"]) == [EVENT_TYPE_P1]
+
     async def test_get_room_status_with_active_irrigation(self, coordinator, sample_room):
         """Test getting room status with active irrigation."""
         coordinator._rooms[sample_room.room_id] = sample_room
-        coordinator._active_irrigations[sample_room.room_id] = {
-            "event_type": EVENT_TYPE_P1,
-            "current_shot": 1,
-            "total_shots": 2,
-            "progress": 0.5
-        }
+        coordinator._active_irrigations[sample_room.room_id] = ActiveIrrigation(
+            event_type=EVENT_TYPE_P1,
+            shots=[],
+            total_shots=2,
+            start_time=datetime(2024, 1, 1, 8, 0),
+            total_duration=75,
+            current_shot=1,
+            progress=0.5
+        )
         
         status = coordinator.get_room_status(sample_room.room_id)
         
@@ -181,6 +279,13 @@ class TestIrrigationCoordinator:
         assert status["active_irrigation_details"]["event_type"] == EVENT_TYPE_P1
         assert status["active_irrigation_details"]["current_shot"] == 1
         assert status["active_irrigation_details"]["progress"] == 0.5
+        assert status["active_irrigation_details"]["shot_start_time"] is None
+        
+        # A started shot reports its wall-clock start time
+        coordinator._active_irrigations[sample_room.room_id].shot_start_monotonic = time.monotonic() - 10
+        status = coordinator.get_room_status(sample_room.room_id)
+        
+        assert isinstance(status["active_irrigation_details"]["shot_start_time"], datetime)
 
     async def test_check_fail_safes_all_pass(self, coordinator, sample_room):
         """Test fail-safe checks when all pass."""
@@ -193,8 +298,8 @@ class TestIrrigationCoordinator:
         
         result = await coordinator._check_fail_safes(sample_room.room_id, 300)
         
-        assert result["allowed"] is True
-        assert result["reason"] == ""
+        assert result.allowed is True
+        assert result.reason == ""
 
     async def test_check_fail_safes_light_schedule_conflict(self, coordinator, sample_room):
         """Test fail-safe checks with light schedule conflict."""
@@ -211,8 +316,8 @@ class TestIrrigationCoordinator:
         
         result = await coordinator._check_fail_safes(sample_room.room_id, 300)
         
-        assert result["allowed"] is False
-        assert "lights are off" in result["reason"]
+        assert result.allowed is False
+        assert "lights are off" in result.reason
 
     async def test_check_fail_safes_overwatering_prevention(self, coordinator, sample_room):
         """Test fail-safe checks with overwatering prevention."""
@@ -225,8 +330,8 @@ class TestIrrigationCoordinator:
         
         result = await coordinator._check_fail_safes(sample_room.room_id, 200)  # Would exceed limit
         
-        assert result["allowed"] is False
-        assert "Daily irrigation limit exceeded" in result["reason"]
+        assert result.allowed is False
+        assert "Daily irrigation limit exceeded" in result.reason
 
     async def test_check_fail_safes_entity_unavailable(self, coordinator, sample_room):
         """Test fail-safe checks with unavailable entities."""
@@ -243,8 +348,16 @@ class TestIrrigationCoordinator:
         
         result = await coordinator._check_fail_safes(sample_room.room_id, 300)
         
-        assert result["allowed"] is False
-        assert "Unavailable entities" in result["reason"]
+        assert result.allowed is False
+        assert "Unavailable entities" in result.reason
+
+    async def test_first_unavailable_entity_stops_at_pump(self, coordinator, sample_room):
+        """Test the availability gate reports the first unavailable entity only."""
+        states = {sample_room.pump_entity: MagicMock(state="unavailable")}
+        
+        result = coordinator._first_unavailable_entity(sample_room, states)
+        
+        assert result == f"pump: {sample_room.pump_entity}"
 
     async def test_check_fail_safes_irrigation_conflict(self, coordinator, sample_room):
         """Test fail-safe checks with irrigation conflict."""
@@ -254,8 +367,8 @@ class TestIrrigationCoordinator:
         
         result = await coordinator._check_fail_safes(sample_room.room_id, 300)
         
-        assert result["allowed"] is False
-        assert "already active" in result["reason"]
+        assert result.allowed is False
+        assert "already active" in result.reason
 
     async def test_activate_pump_success(self, coordinator):
         """Test successful pump activation."""
@@ -286,7 +399,9 @@ class TestIrrigationCoordinator:
         result = await coordinator._activate_zones("room1", zones)
         
         assert result is True
-        assert coordinator.hass.services.async_call.call_count == 2
+        coordinator.hass.services.async_call.assert_called_once_with(
+            "switch", "turn_on", {"entity_id": zones}
+        )
 
     async def test_activate_zones_partial_success(self, coordinator):
         """Test zone activation with some zones unavailable."""
@@ -302,7 +417,9 @@ class TestIrrigationCoordinator:
         result = await coordinator._activate_zones("room1", zones)
         
         assert result is True  # At least one zone activated
-        coordinator.hass.services.async_call.assert_called_once()
+        coordinator.hass.services.async_call.assert_called_once_with(
+            "switch", "turn_on", {"entity_id": ["switch.zone1"]}
+        )
 
     async def test_deactivate_pump_success(self, coordinator):
         """Test successful pump deactivation."""
@@ -323,7 +440,291 @@ class TestIrrigationCoordinator:
         result = await coordinator._deactivate_zones("room1", zones)
         
         assert result is True
-        assert coordinator.hass.services.async_call.call_count == 2
+        coordinator.hass.services.async_call.assert_called_once_with(
+            "switch", "turn_off", {"entity_id": zones}
+        )
+
+    async def test_emergency_hardware_reset_turns_off_every_entity(self, coordinator, sample_room):
+        """Test a failing zone does not stop the reset of the other devices."""
+        async def async_call(domain, service, data):
+            if data["entity_id"] == "switch.zone1":
+                raise HomeAssistantError("Zone offline")
+        
+        coordinator.hass.services.async_call = AsyncMock(side_effect=async_call)
+        
+        await coordinator._emergency_hardware_reset(sample_room.room_id, sample_room)
+        
+        turned_off = [call.args[2]["entity_id"] for call in coordinator.hass.services.async_call.call_args_list]
+        assert turned_off == ["switch.zone1", "switch.zone2", "switch.pump1"]
+
+    async def test_emergency_hardware_reset_does_not_wait_on_hung_device(self, coordinator, sample_room, monkeypatch):
+        """Test a hung device is abandoned after the emergency call timeout."""
+        monkeypatch.setattr(
+            "custom_components.irrigation_addon.coordinator._EMERGENCY_CALL_TIMEOUT", 0.01
+        )
+        
+        release = asyncio.Event()
+        completed = []
+        
+        async def async_call(domain, service, data):
+            if data["entity_id"] == "switch.zone2":
+                await release.wait()
+            completed.append(data["entity_id"])
+        
+        coordinator.hass.services.async_call = AsyncMock(side_effect=async_call)
+        coordinator.irrigation_logger = MagicMock()
+        
+        await asyncio.wait_for(
+            coordinator._emergency_hardware_reset(sample_room.room_id, sample_room), 1
+        )
+        
+        coordinator.irrigation_logger.error.assert_called_once()
+        assert "switch.zone2" in coordinator.irrigation_logger.error.call_args.args[0]
+        
+        # The abandoned call is shielded, so it still completes once the device responds
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert "switch.zone2" in completed
+
+    async def test_execute_shots_keeps_pump_on_for_short_intervals(self, coordinator, sample_room):
+        """Test the pump stays on between shots separated by a short interval."""
+        shots = [Shot(duration=30, interval_after=2), Shot(duration=30, interval_after=60), Shot(duration=30)]
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator._settings = {"pump_zone_delay": 3}
+        coordinator._active_irrigations[sample_room.room_id] = ActiveIrrigation(
+            event_type=EVENT_TYPE_P1,
+            shots=shots,
+            total_shots=3,
+            start_time=datetime(2024, 1, 1, 8, 0),
+            total_duration=90
+        )
+        coordinator._activate_pump = AsyncMock(return_value=True)
+        coordinator._deactivate_pump = AsyncMock(return_value=True)
+        coordinator._activate_zones = AsyncMock(return_value=True)
+        coordinator._deactivate_zones = AsyncMock(return_value=True)
+        coordinator._async_wait_for_stop = AsyncMock(return_value=False)
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock):
+            result = await coordinator._execute_irrigation_shots(sample_room.room_id, shots)
+        
+        assert result is True
+        assert coordinator._activate_zones.call_count == 3
+        assert coordinator._activate_pump.call_count == 2
+        assert coordinator._deactivate_pump.call_count == 2
+
+    async def test_execute_shots_stop_during_pump_start_turns_room_off(self, coordinator, sample_room):
+        """Test a stop that arrives while the pump starts leaves no zone open."""
+        shots = [Shot(duration=30)]
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator._settings = {"pump_zone_delay": 3}
+        irrigation_state = ActiveIrrigation(
+            event_type=EVENT_TYPE_P1,
+            shots=shots,
+            total_shots=1,
+            start_time=datetime(2024, 1, 1, 8, 0),
+            total_duration=30
+        )
+        coordinator._active_irrigations[sample_room.room_id] = irrigation_state
+
+        async def activate_pump(room_id, pump_entity):
+            irrigation_state.stop_event.set()
+            return True
+
+        coordinator._activate_pump = AsyncMock(side_effect=activate_pump)
+        coordinator._activate_zones = AsyncMock(return_value=True)
+        coordinator._async_deactivate_room = AsyncMock()
+
+        result = await coordinator._execute_irrigation_shots(sample_room.room_id, shots)
+
+        assert result is False
+        coordinator._activate_zones.assert_not_called()
+        coordinator._async_deactivate_room.assert_awaited_once_with(sample_room.room_id, sample_room)
+
+    async def test_execute_shots_stop_during_shot_turns_room_off(self, coordinator, sample_room):
+        """Test the room is switched off when a shot is stopped."""
+        shots = [Shot(duration=30)]
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator._settings = {"pump_zone_delay": 3}
+        coordinator._active_irrigations[sample_room.room_id] = ActiveIrrigation(
+            event_type=EVENT_TYPE_P1,
+            shots=shots,
+            total_shots=1,
+            start_time=datetime(2024, 1, 1, 8, 0),
+            total_duration=30
+        )
+        coordinator._activate_pump = AsyncMock(return_value=True)
+        coordinator._activate_zones = AsyncMock(return_value=True)
+        coordinator._async_deactivate_room = AsyncMock()
+        coordinator._async_wait_for_stop = AsyncMock(side_effect=[False, True])
+
+        result = await coordinator._execute_irrigation_shots(sample_room.room_id, shots)
+
+        assert result is False
+        coordinator._activate_zones.assert_awaited_once()
+        coordinator._async_deactivate_room.assert_awaited_once_with(sample_room.room_id, sample_room)
+
+    async def test_schedule_event_next_run_is_local(self, coordinator, sample_event):
+        """Test scheduled next_run times stay in the configured local time zone."""
+        original_time_zone = dt_util.DEFAULT_TIME_ZONE
+        dt_util.set_default_time_zone(dt_util.get_time_zone("Pacific/Auckland"))
+        try:
+            with patch('custom_components.irrigation_addon.coordinator.async_call_later'):
+                await coordinator._schedule_event("room1", sample_event)
+        finally:
+            dt_util.set_default_time_zone(original_time_zone)
+        
+        assert sample_event.next_run.tzinfo == dt_util.get_time_zone("Pacific/Auckland")
+        assert (sample_event.next_run.hour, sample_event.next_run.minute) == (8, 0)
+
+    async def test_daily_reset_rescheduling_replaces_pending_timer(self, coordinator):
+        """Test reloading storage does not leave a second midnight reset behind."""
+        first_cancel, second_cancel = MagicMock(), MagicMock()
+        
+        with patch(
+            'custom_components.irrigation_addon.coordinator.async_call_later',
+            side_effect=[first_cancel, second_cancel]
+        ):
+            coordinator._schedule_daily_reset()
+            coordinator._schedule_daily_reset()
+        
+        first_cancel.assert_called_once()
+        assert first_cancel not in coordinator._event_listeners
+        assert coordinator._daily_reset_cancel is second_cancel
+
+    async def test_daily_reset_delay_spans_dst_change(self, coordinator, monkeypatch):
+        """Test the midnight reset is timed on absolute time across a DST change."""
+        original_time_zone = dt_util.DEFAULT_TIME_ZONE
+        time_zone = dt_util.get_time_zone("Pacific/Auckland")
+        dt_util.set_default_time_zone(time_zone)
+        try:
+            # Clocks go back an hour at 03:00 on 7 April 2024, so this day is 25 hours long
+            now = datetime(2024, 4, 7, 0, 30, tzinfo=time_zone)
+            monkeypatch.setattr(dt_util, "now", lambda time_zone=None: now)
+            monkeypatch.setattr(time, "time", lambda: now.timestamp())
+            
+            with patch('custom_components.irrigation_addon.coordinator.async_call_later') as mock_call_later:
+                coordinator._schedule_daily_reset()
+        finally:
+            dt_util.set_default_time_zone(original_time_zone)
+        
+        assert mock_call_later.call_args.args[1] == 24.5 * 3600
+
+    async def test_scheduled_events_total(self, coordinator, sample_event):
+        """Test the scheduled event count follows scheduling and cancellation."""
+        with patch('custom_components.irrigation_addon.coordinator.async_call_later') as mock_call_later:
+            mock_call_later.return_value = MagicMock()
+            await coordinator._schedule_event("room1", sample_event)
+            await coordinator._schedule_event("room1", sample_event)
+        
+        assert coordinator.get_system_health()["scheduled_events"] == 1
+        
+        await coordinator._cancel_room_scheduled_events("room1")
+        
+        assert coordinator.get_system_health()["scheduled_events"] == 0
+        mock_call_later.return_value.assert_called_once()
+
+    async def test_scheduled_event_defers_room_save(self, coordinator, sample_room, sample_event):
+        """Test scheduled runs batch their room saves."""
+        sample_room.events = [sample_event]
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator.async_execute_irrigation_event = AsyncMock(return_value=True)
+        coordinator._schedule_event = AsyncMock()
+        coordinator.storage.async_save_room = AsyncMock()
+        coordinator.storage.async_save_rooms = AsyncMock()
+        
+        with patch('custom_components.irrigation_addon.coordinator.async_call_later') as mock_call_later:
+            await coordinator._execute_scheduled_event(sample_room.room_id, sample_event)
+            await coordinator._execute_scheduled_event(sample_room.room_id, sample_event)
+        
+        coordinator.storage.async_save_room.assert_not_called()
+        mock_call_later.assert_called_once()
+        assert sample_event.last_run is not None
+        
+        await coordinator._async_flush_dirty_rooms()
+        
+        coordinator.storage.async_save_rooms.assert_called_once_with([sample_room])
+        assert not coordinator._dirty_rooms
+
+    async def test_pending_room_writes_flushed_on_stop(self, coordinator, sample_room):
+        """Test batched room writes are saved when Home Assistant stops."""
+        coordinator.storage.async_save_rooms = AsyncMock()
+        
+        await coordinator._async_setup()
+        
+        coordinator._rooms[sample_room.room_id] = sample_room
+        coordinator.hass.bus.async_listen_once.assert_called_once()
+        event_type, on_stop = coordinator.hass.bus.async_listen_once.call_args.args
+        assert event_type == EVENT_HOMEASSISTANT_STOP
+        
+        cancel_flush = MagicMock()
+        coordinator._dirty_rooms.add(sample_room.room_id)
+        coordinator._room_flush_cancel = cancel_flush
+        
+        await on_stop(MagicMock())
+        
+        cancel_flush.assert_called_once()
+        coordinator.storage.async_save_rooms.assert_called_once_with([sample_room])
+        assert coordinator._stop_listener_cancel is None
+
+    async def test_error_statistics_cached_until_next_error(self, coordinator):
+        """Test error statistics are rebuilt only after a new error."""
+        coordinator._record_error("zone_control", HomeAssistantError("boom"))
+        first = coordinator.get_error_statistics()
+        cache = coordinator._error_stats_cache
+        
+        # Changing the returned statistics leaves the cached ones intact
+        first["error_counts"].clear()
+        first["recent_errors"][0]["error_type"] = "changed"
+        repeated = coordinator.get_error_statistics()
+        
+        assert coordinator._error_stats_cache is cache
+        assert repeated["error_counts"] == {"zone_control:HomeAssistantError": 1}
+        assert repeated["recent_errors"][0]["error_type"] == "HomeAssistantError"
+        
+        coordinator._record_error("pump_control", HomeAssistantError("boom"))
+        second = coordinator.get_error_statistics()
+        
+        assert second["total_errors"] == 2
+        assert second["error_rate"] == 2.0
+
+    async def test_error_rate_counts_last_hour(self, coordinator):
+        """Test the error rate only counts errors from the last hour."""
+        coordinator._record_error("zone_control", HomeAssistantError("old"))
+        coordinator._record_error("zone_control", HomeAssistantError("new"))
+        coordinator._error_timestamps[0] -= 3601
+        
+        assert coordinator._calculate_error_rate() == 1.0
+        
+        coordinator.clear_error_history()
+        
+        assert coordinator._calculate_error_rate() == 0.0
+        assert coordinator.get_error_statistics()["total_errors"] == 0
+
+    async def test_notification_gate_follows_settings(self, coordinator):
+        """Test the notification gate is rebound when settings change."""
+        assert coordinator.should_send_notification("error") is True
+        
+        await coordinator.async_update_settings({"error_notifications": False})
+        
+        assert coordinator.should_send_notification("error") is False
+        assert coordinator.should_send_notification("general") is True
+        
+        await coordinator.async_update_settings({"notifications_enabled": False})
+        
+        assert coordinator.should_send_notification("general") is False
+
+    async def test_error_statistics_join_count_keys(self, coordinator):
+        """Test error counts are reported under operation:type keys."""
+        coordinator._record_error("zone_control", HomeAssistantError("boom"))
+        coordinator._record_error("zone_control", HomeAssistantError("boom again"))
+        
+        stats = coordinator.get_error_statistics()
+        
+        assert stats["error_counts"] == {"zone_control:HomeAssistantError": 2}
+        assert stats["most_common_errors"] == [
+            {"error_type": "zone_control:HomeAssistantError", "count": 2}
+        ]
 
     async def test_get_system_health_healthy(self, coordinator):
         """Test system health when everything is healthy."""
@@ -353,6 +754,92 @@ class TestIrrigationCoordinator:
         assert len(health["issues"]) > 0
         assert any("Daily limit reached" in issue for issue in health["issues"])
 
+    async def test_status_daily_totals_are_snapshots(self, coordinator):
+        """Test status getters return plain copies of the daily totals."""
+        coordinator._daily_irrigation_totals["room1"] = 120
+        
+        fail_safe = coordinator.get_fail_safe_status()
+        health = coordinator.get_system_health()
+        coordinator._daily_irrigation_totals["room1"] = 240
+        
+        assert fail_safe["daily_totals"] == {"room1": 120}
+        assert health["daily_totals"] == {"room1": 120}
+        assert type(health["daily_totals"]) is dict
+
+    async def test_get_system_health_long_running(self, coordinator):
+        """Test long-running irrigations are measured on the monotonic clock."""
+        coordinator._rooms = {"room1": MagicMock()}
+        coordinator._settings = {"fail_safe_enabled": True}
+        coordinator._daily_irrigation_totals = {}
+        coordinator._active_irrigations = {
+            "room1": ActiveIrrigation(
+                event_type=EVENT_TYPE_P1,
+                shots=[],
+                total_shots=0,
+                start_time=datetime(2024, 1, 1, 8, 0),
+                total_duration=0,
+                start_monotonic=time.monotonic() - 7300
+            )
+        }
+        coordinator._manual_runs = {
+            "room1": {"start_time": datetime(2024, 1, 1, 8, 0), "start_monotonic": time.monotonic() - 60}
+        }
+        
+        health = coordinator.get_system_health()
+        
+        assert health["issues"] == ["Long-running irrigation in room room1"]
+
+    async def test_update_data_without_rooms_has_full_shape(self, coordinator):
+        """Test the payload keeps the same keys when no rooms are configured."""
+        data = await coordinator._async_update_data()
+        
+        assert set(data) == {"rooms", "sensor_data", "settings", "system_health"}
+        assert data["sensor_data"] == {}
+
+    async def test_progress_updates_run_until_idle(self, coordinator):
+        """Test listeners are refreshed while a run is active and the timer stops afterwards."""
+        cancel = MagicMock()
+        coordinator.async_update_listeners = MagicMock()
+        
+        with patch(
+            'custom_components.irrigation_addon.coordinator.async_track_time_interval',
+            return_value=cancel
+        ) as mock_track:
+            coordinator._async_start_progress_updates()
+            coordinator._async_start_progress_updates()
+        
+        mock_track.assert_called_once()
+        
+        coordinator._manual_runs["room1"] = {"duration": 60}
+        coordinator._async_progress_tick(datetime(2024, 1, 1, 8, 0))
+        cancel.assert_not_called()
+        
+        coordinator._manual_runs.clear()
+        coordinator._async_progress_tick(datetime(2024, 1, 1, 8, 0))
+        cancel.assert_called_once()
+        assert coordinator.async_update_listeners.call_count == 2
+
+    async def test_stop_irrigation_publishes_once(self, coordinator, sample_room):
+        """Test stopping a manual run and a scheduled run notifies listeners once."""
+        coordinator._rooms = {sample_room.room_id: sample_room}
+        coordinator._manual_runs = {sample_room.room_id: {"duration": 60}}
+        coordinator._active_irrigations = {
+            sample_room.room_id: ActiveIrrigation(
+                event_type=EVENT_TYPE_P1,
+                shots=[],
+                total_shots=0,
+                start_time=datetime(2024, 1, 1, 8, 0),
+                total_duration=0
+            )
+        }
+        coordinator._async_deactivate_room = AsyncMock()
+        coordinator._async_publish_changes = MagicMock()
+        
+        assert await coordinator.async_stop_irrigation(sample_room.room_id) is True
+        
+        assert coordinator._async_deactivate_room.call_count == 2
+        coordinator._async_publish_changes.assert_called_once()
+
     async def test_emergency_stop_all(self, coordinator, sample_room):
         """Test emergency stop for all rooms."""
         coordinator._rooms = {sample_room.room_id: sample_room}
@@ -366,10 +853,33 @@ class TestIrrigationCoordinator:
         
         results = await coordinator.async_emergency_stop_all()
         
-        coordinator.async_stop_irrigation.assert_called_once_with(sample_room.room_id)
+        coordinator.async_stop_irrigation.assert_called_once_with(sample_room.room_id, publish=False)
         coordinator._deactivate_zones.assert_called_once()
         coordinator._deactivate_pump.assert_called_once()
         coordinator.async_request_refresh.assert_called_once()
         
         assert results[f"{sample_room.room_id}_irrigation"] is True
-        assert results[f"{sample_room.room_id}_safety_shutoff"] is True
\ No newline at end of file
+        assert results[f"{sample_room.room_id}_safety_shutoff"] is True
+
+    async def test_emergency_stop_all_shuts_off_rooms_independently(self, coordinator):
+        """Test a failed shutoff in one room does not affect the others."""
+        coordinator._rooms = {
+            "room1": MagicMock(zone_entities=["switch.zone1"], pump_entity="switch.pump1"),
+            "room2": MagicMock(zone_entities=["switch.zone2"], pump_entity="switch.pump2"),
+        }
+        coordinator._active_irrigations = {}
+        coordinator._manual_runs = {}
+        
+        async def deactivate_zones(room_id, zone_entities):
+            return room_id != "room1"
+        
+        coordinator._deactivate_zones = AsyncMock(side_effect=deactivate_zones)
+        coordinator._deactivate_pump = AsyncMock(return_value=True)
+        coordinator.async_request_refresh = AsyncMock()
+        
+        results = await coordinator.async_emergency_stop_all()
+        
+        assert results["room1_safety_shutoff"] is False
+        assert results["room2_safety_shutoff"] is True
+        # A failed zone shutoff does not keep the room's pump from being turned off
+        assert coordinator._deactivate_pump.call_count == 2
@@ -6,9 +6,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import HomeAssistantError
 
-from custom_components.irrigation_addon import async_setup_entry, async_unload_entry
+from custom_components.irrigation_addon import async_reload_entry, async_setup_entry, async_unload_entry
 from custom_components.irrigation_addon.coordinator import IrrigationCoordinator
-from custom_components.irrigation_addon.models import Room, IrrigationEvent, Shot
+from custom_components.irrigation_addon.models import ActiveIrrigation, Room, IrrigationEvent, Shot, IrrigationDomainData
 from custom_components.irrigation_addon.const import DOMAIN, EVENT_TYPE_P1, EVENT_TYPE_P2
 
 
@@ -19,7 +19,7 @@ class TestIntegrationSetup:
     async def mock_hass_with_services(self):
         """Create a mock Home Assistant with service registry."""
         hass = MagicMock(spec=HomeAssistant)
-        hass.data = {DOMAIN: {}}
+        hass.data = {DOMAIN: IrrigationDomainData()}
         hass.states = MagicMock()
         hass.services = MagicMock()
         hass.services.async_register = MagicMock()
@@ -50,14 +50,15 @@ class TestIntegrationSetup:
         """Test successful integration setup."""
         with patch('custom_components.irrigation_addon.IrrigationCoordinator') as mock_coordinator_class:
             mock_coordinator = AsyncMock()
-            mock_coordinator.async_setup = AsyncMock()
+            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
             mock_coordinator_class.return_value = mock_coordinator
             
             result = await async_setup_entry(mock_hass_with_services, mock_config_entry_full)
             
             assert result is True
-            assert mock_config_entry_full.entry_id in mock_hass_with_services.data[DOMAIN]
-            mock_coordinator.async_setup.assert_called_once()
+            assert mock_config_entry_full.entry_id in mock_hass_with_services.data[DOMAIN].coordinators
+            mock_coordinator.async_config_entry_first_refresh.assert_called_once()
+            mock_coordinator.async_setup.assert_not_called()
             
             # Verify services are registered
             assert mock_hass_with_services.services.async_register.call_count >= 4
@@ -66,7 +67,7 @@ class TestIntegrationSetup:
         """Test integration setup with coordinator failure."""
         with patch('custom_components.irrigation_addon.IrrigationCoordinator') as mock_coordinator_class:
             mock_coordinator = AsyncMock()
-            mock_coordinator.async_setup.side_effect = Exception("Setup failed")
+            mock_coordinator.async_config_entry_first_refresh.side_effect = Exception("Setup failed")
             mock_coordinator_class.return_value = mock_coordinator
             
             result = await async_setup_entry(mock_hass_with_services, mock_config_entry_full)
@@ -78,13 +79,36 @@ class TestIntegrationSetup:
         # Setup coordinator in hass data
         mock_coordinator = AsyncMock()
         mock_coordinator.async_shutdown = AsyncMock()
-        mock_hass_with_services.data[DOMAIN][mock_config_entry_full.entry_id] = mock_coordinator
+        mock_hass_with_services.data[DOMAIN].coordinators[mock_config_entry_full.entry_id] = mock_coordinator
         
         result = await async_unload_entry(mock_hass_with_services, mock_config_entry_full)
         
         assert result is True
         mock_coordinator.async_shutdown.assert_called_once()
-        assert mock_config_entry_full.entry_id not in mock_hass_with_services.data[DOMAIN]
+        assert mock_config_entry_full.entry_id not in mock_hass_with_services.data[DOMAIN].coordinators
+
+    async def test_async_reload_entry_keeps_services(self, mock_hass_with_services, mock_config_entry_full):
+        """Test reload refreshes the existing coordinator without removing services."""
+        coordinator = AsyncMock()
+        domain_data = mock_hass_with_services.data[DOMAIN]
+        domain_data.coordinators[mock_config_entry_full.entry_id] = coordinator
+        domain_data.services = MagicMock()
+        mock_hass_with_services.config_entries = MagicMock()
+        mock_hass_with_services.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        mock_hass_with_services.config_entries.async_forward_entry_setups = AsyncMock()
+        
+        with patch('custom_components.irrigation_addon.IrrigationCoordinator') as mock_coordinator_class:
+            result = await async_reload_entry(mock_hass_with_services, mock_config_entry_full)
+        
+        assert result is True
+        mock_coordinator_class.assert_not_called()
+        coordinator.async_shutdown.assert_not_called()
+        coordinator.async_reload_storage.assert_awaited_once()
+        coordinator.async_refresh.assert_awaited_once()
+        coordinator.async_config_entry_first_refresh.assert_not_called()
+        mock_hass_with_services.config_entries.async_forward_entry_setups.assert_awaited_once()
+        assert domain_data.coordinators[mock_config_entry_full.entry_id] is coordinator
+        domain_data.services.async_remove_services.assert_not_called()
 
     async def test_async_unload_entry_not_loaded(self, mock_hass_with_services, mock_config_entry_full):
         """Test unloading entry that wasn't loaded."""
@@ -142,7 +166,8 @@ class TestEndToEndIrrigationCycles:
         # Mock storage operations
         coordinator.storage.async_add_history_event = AsyncMock()
         coordinator.storage.async_record_irrigation_cycle = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
+        coordinator._async_wait_for_stop = AsyncMock(return_value=False)
         
         # Mock sleep to speed up test
         with patch('asyncio.sleep', new_callable=AsyncMock):
@@ -215,10 +240,10 @@ class TestEndToEndIrrigationCycles:
         coordinator.hass.states.get.return_value = MagicMock(state="on")
         coordinator.hass.services.async_call = AsyncMock()
         coordinator.storage.async_add_history_event = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
         
         # Mock time tracking
-        with patch('custom_components.irrigation_addon.coordinator.async_track_point_in_time') as mock_track:
+        with patch('custom_components.irrigation_addon.coordinator.async_call_later') as mock_track:
             mock_track.return_value = MagicMock()  # Cancel callback
             
             result = await coordinator.async_start_manual_run("test_room", 300)
@@ -240,15 +265,18 @@ class TestEndToEndIrrigationCycles:
         coordinator, test_room = setup_coordinator_with_room
         
         # Setup active irrigation state
-        coordinator._active_irrigations["test_room"] = {
-            "event_type": EVENT_TYPE_P1,
-            "current_shot": 0,
-            "total_shots": 2
-        }
+        coordinator._active_irrigations["test_room"] = ActiveIrrigation(
+            event_type=EVENT_TYPE_P1,
+            shots=test_room.events[0].shots,
+            total_shots=2,
+            start_time=datetime.now(),
+            total_duration=75
+        )
         
         # Mock services
         coordinator.hass.services.async_call = AsyncMock()
         coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_set_updated_data = MagicMock()
         
         result = await coordinator.async_emergency_stop_room("test_room")
         
@@ -409,8 +437,8 @@ class TestFailSafeScenarios:
         # Test request that would exceed limit
         result = await coordinator._check_fail_safes("test_room", 200)  # Would exceed by 100s
         
-        assert result["allowed"] is False
-        assert "Daily irrigation limit exceeded" in result["reason"]
+        assert result.allowed is False
+        assert "Daily irrigation limit exceeded" in result.reason
 
     async def test_daily_limit_within_bounds(self, coordinator_with_fail_safes):
         """Test irrigation allowed within daily limits."""
@@ -425,7 +453,7 @@ class TestFailSafeScenarios:
         # Test request within limit
         result = await coordinator._check_fail_safes("test_room", 300)  # 5 more minutes
         
-        assert result["allowed"] is True
+        assert result.allowed is True
 
     async def test_light_schedule_integration(self, coordinator_with_fail_safes):
         """Test light schedule integration scenarios."""
@@ -434,7 +462,7 @@ class TestFailSafeScenarios:
         # Test with lights on (should allow)
         coordinator.hass.states.get.return_value = MagicMock(state="on")
         result = await coordinator._check_fail_safes("test_room", 300)
-        assert result["allowed"] is True
+        assert result.allowed is True
         
         # Test with lights off (should block)
         def mock_get_state(entity_id):
@@ -444,8 +472,8 @@ class TestFailSafeScenarios:
         
         coordinator.hass.states.get.side_effect = mock_get_state
         result = await coordinator._check_fail_safes("test_room", 300)
-        assert result["allowed"] is False
-        assert "lights are off" in result["reason"]
+        assert result.allowed is False
+        assert "lights are off" in result.reason
 
     async def test_concurrent_irrigation_prevention(self, coordinator_with_fail_safes):
         """Test prevention of concurrent irrigation operations."""
@@ -459,8 +487,8 @@ class TestFailSafeScenarios:
         
         result = await coordinator._check_fail_safes("test_room", 300)
         
-        assert result["allowed"] is False
-        assert "already active" in result["reason"]
+        assert result.allowed is False
+        assert "already active" in result.reason
 
     async def test_fail_safe_disabled(self, coordinator_with_fail_safes):
         """Test behavior when fail-safes are disabled."""
@@ -475,7 +503,7 @@ class TestFailSafeScenarios:
         
         result = await coordinator._check_fail_safes("test_room", 300)
         
-        assert result["allowed"] is True  # Should allow when disabled
+        assert result.allowed is True  # Should allow when disabled
 
 
 class TestSystemHealthMonitoring:
@@ -511,12 +539,12 @@ class TestSystemHealthMonitoring:
         assert len(health["issues"]) > 0
         assert any("Daily limit reached" in issue for issue in health["issues"])
 
-    async def test_room_safety_validation(self, setup_coordinator_with_room):
+    async def test_room_safety_validation(self, setup_coordinator_with_room, monkeypatch):
         """Test room safety validation."""
         coordinator, test_room = setup_coordinator_with_room
         
         # Mock entity validation
-        test_room.validate_entities_exist = AsyncMock(return_value=[])
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=[]))
         coordinator.hass.states.get.return_value = MagicMock(state="on")
         coordinator._daily_irrigation_totals = {"test_room": 1000}
         coordinator._settings["max_daily_irrigation"] = 3600
@@ -528,12 +556,12 @@ class TestSystemHealthMonitoring:
         assert validation["daily_usage"] == 1000
         assert validation["remaining_daily"] == 2600
 
-    async def test_room_safety_validation_with_issues(self, setup_coordinator_with_room):
+    async def test_room_safety_validation_with_issues(self, setup_coordinator_with_room, monkeypatch):
         """Test room safety validation with issues."""
         coordinator, test_room = setup_coordinator_with_room
         
         # Mock missing entities
-        test_room.validate_entities_exist = AsyncMock(return_value=["switch.missing_pump"])
+        monkeypatch.setattr(Room, "validate_entities_exist", AsyncMock(return_value=["switch.missing_pump"]))
         
         # Mock light entity unavailable
         def mock_get_state(entity_id):
@@ -182,6 +182,19 @@ class TestIrrigationStorage:
         assert storage._data["rooms"]["room1"]["name"] == "Test Room"
         storage.async_save.assert_called_once()
 
+    async def test_async_save_rooms(self, storage, sample_room_data):
+        """Test saving several rooms with one write."""
+        storage._loaded = True
+        storage._data = {"rooms": {}}
+        storage.async_save = AsyncMock()
+        
+        second_room_data = {**sample_room_data, "room_id": "room2", "name": "Second Room"}
+        rooms = [Room.from_dict(sample_room_data), Room.from_dict(second_room_data)]
+        await storage.async_save_rooms(rooms)
+        
+        assert set(storage._data["rooms"]) == {"room1", "room2"}
+        storage.async_save.assert_called_once()
+
     async def test_async_save_room_not_loaded(self, storage, sample_room_data):
         """Test saving room when storage not loaded."""
         storage._loaded = False
@@ -255,6 +268,33 @@ class TestIrrigationStorage:
         assert "room1" not in storage._data["rooms"]
         storage.async_save.assert_called_once()
 
+    async def test_get_room_names_lower(self, storage, sample_room_data):
+        """Test lowercased room name index is rebuilt after room changes."""
+        storage._loaded = True
+        storage._data = {"rooms": {"room1": sample_room_data}}
+        storage.async_save = AsyncMock()
+        
+        assert storage.get_room_names_lower() == frozenset({"test room"})
+        
+        await storage.async_delete_room("room1")
+        
+        assert storage.get_room_names_lower() == frozenset()
+
+    async def test_get_room_options(self, storage, sample_room_data):
+        """Test room selector labels are cached until rooms change."""
+        storage._loaded = True
+        storage._data = {"rooms": {"room1": sample_room_data}}
+        storage.async_save = AsyncMock()
+        
+        options = storage.get_room_options()
+        
+        assert options == ["room1: Test Room"]
+        assert storage.get_room_options() is options
+        
+        await storage.async_delete_room("room1")
+        
+        assert storage.get_room_options() == []
+
     async def test_async_delete_room_not_found(self, storage):
         """Test deleting a non-existent room."""
         storage._loaded = True